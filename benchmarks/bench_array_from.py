@@ -0,0 +1,42 @@
+"""Building a 10^6 element array from a list, a generator and a buffer."""
+import array as py_array
+import ctypes
+from timeit import timeit
+
+from pointers import array, array_from
+
+N = 1_000_000
+
+
+def old_array(*seq):
+    # what array() used to do, minus the add_ref that leaked it
+    f_type = type(seq[0])
+
+    for i in seq:
+        if type(i) is not f_type:
+            raise ValueError("all values in the array must be the same type")
+
+    return (ctypes.c_int * len(seq))(*seq)
+
+
+def per_call(stmt, number: int = 5) -> float:
+    return timeit(stmt, number=number) / number * 1e3
+
+
+if __name__ == "__main__":
+    values = list(range(N))
+    buffer = py_array.array("i", values)
+
+    results = {
+        "old array(*list)": lambda: old_array(*values),
+        "array(*list)": lambda: array(*values),
+        "array_from(list)": lambda: array_from(values),
+        "array_from(gen)": lambda: array_from(i for i in range(N)),
+        "array_from(buffer)": lambda: array_from(buffer),
+    }
+    base = per_call(results.pop("old array(*list)"))
+    print(f"{'old array(*list)':>20}: {base:8.2f} ms")
+
+    for name, fn in results.items():
+        ms = per_call(fn)
+        print(f"{name:>20}: {ms:8.2f} ms ({base / ms:.1f}x)")
@@ -0,0 +1,41 @@
+"""Per-call cost of `binding_base` compared to calling ctypes directly."""
+import ctypes
+from timeit import timeit
+
+from pointers import _cstd as std
+from pointers import c_free, c_malloc, memcpy, strlen
+from pointers.bindings import binding_base
+
+N = 200_000
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+if __name__ == "__main__":
+    dest = c_malloc(16)
+    src = c_malloc(16)
+    raw_dest = ctypes.c_void_p(dest.ensure())
+    raw_src = ctypes.c_void_p(src.ensure())
+
+    results = {
+        "strlen (ctypes)": per_call(lambda: std.dll.strlen(b"test")),
+        "strlen (binding_base)": per_call(
+            lambda: binding_base(std.dll.strlen, b"test"),
+        ),
+        "strlen (wrapper)": per_call(lambda: strlen(b"test")),
+        "memcpy (ctypes)": per_call(
+            lambda: std.dll.memcpy(raw_dest, raw_src, 16),
+        ),
+        "memcpy (binding_base)": per_call(
+            lambda: binding_base(std.dll.memcpy, dest, src, 16),
+        ),
+        "memcpy (wrapper)": per_call(lambda: memcpy(dest, src, 16)),
+    }
+
+    c_free(dest)
+    c_free(src)
+
+    for name, ns in results.items():
+        print(f"{name:>24}: {ns:8.1f} ns/call")
@@ -0,0 +1,48 @@
+"""Element access and bulk operations on a 10^6 element `CArrayPointer`."""
+import array as py_array
+from timeit import timeit
+
+from pointers import array
+
+N = 1_000_000
+
+
+def old_getitem(ptr, index: int):
+    # what __getitem__ used to do: dereference everything, then index
+    elements = ptr._as_parameter_
+    return [elements[i] for i in range(ptr.length)][index]
+
+
+def per_op(stmt, number: int, ops: int = 1) -> float:
+    return timeit(stmt, number=number) / (number * ops) * 1e9
+
+
+if __name__ == "__main__":
+    ptr = array(*range(N))
+    source = py_array.array("i", range(N))
+    values = list(range(N))
+
+    old = per_op(lambda: old_getitem(ptr, N // 2), 5)
+    new = per_op(lambda: ptr[N // 2], 200_000)
+    print(f"{'old ptr[i]':>20}: {old:14.1f} ns/op")
+    print(f"{'ptr[i]':>20}: {new:14.1f} ns/op ({old / new:.0f}x)")
+
+    def setitems() -> None:
+        for i in range(0, N, 1000):
+            ptr[i] = i
+
+    setitem = per_op(setitems, 100, N // 1000)
+    print(f"{'ptr[i] = v':>20}: {setitem:14.1f} ns/op")
+    getslice = per_op(lambda: ptr[10:20], 100_000)
+    print(f"{'ptr[a:b]':>20}: {getslice:14.1f} ns/op")
+
+    results = {
+        "tolist()": lambda: ptr.tolist(),
+        "fill(v)": lambda: ptr.fill(1),
+        "copy_from(buffer)": lambda: ptr.copy_from(source),
+        "copy_from(list)": lambda: ptr.copy_from(values),
+    }
+
+    for name, fn in results.items():
+        ms = per_op(fn, 10) / 1e6
+        print(f"{name:>20}: {ms:14.3f} ms/call")
@@ -0,0 +1,39 @@
+"""Overhead of the decay decorators compared to the undecorated function."""
+from timeit import timeit
+
+from typing_extensions import Annotated
+
+from pointers import Pointer, decay, decay_annotated, to_ptr
+
+N = 100_000
+
+
+def plain(a: str, b: int, c: Pointer[str]) -> None:
+    ...
+
+
+@decay
+def decayed(a: str, b: int, c: Pointer[str]) -> None:
+    ...
+
+
+@decay_annotated
+def annotated(a: str, b: int, c: Annotated[str, Pointer]) -> None:
+    ...
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+if __name__ == "__main__":
+    results = {
+        "plain": lambda: plain("a", 1, "c"),
+        "plain + to_ptr": lambda: plain("a", 1, to_ptr("c")),
+        "decay": lambda: decayed("a", 1, "c"),
+        "decay (keywords)": lambda: decayed("a", b=1, c="c"),
+        "decay_annotated": lambda: annotated("a", 1, "c"),
+    }
+
+    for name, stmt in results.items():
+        print(f"{name:>18}: {per_call(stmt):8.1f} ns/call")
@@ -0,0 +1,46 @@
+"""Per-call overhead of the SIGSEGV guard used by `handle`."""
+import faulthandler
+from timeit import timeit
+
+from _pointers import handle as _handle
+
+from pointers import handle, unchecked
+
+N = 1_000_000
+
+
+def noop(a, b=None):
+    return a
+
+
+guarded = handle(noop)
+
+
+def faulthandler_toggling(a, b=None):
+    # what every guarded call used to do before the guard moved into C
+    faulthandler.disable()
+    res = _handle(noop, (a,), {"b": b})
+    faulthandler.enable()
+    return res
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+if __name__ == "__main__":
+    base = per_call(lambda: noop(1, b=2))
+    results = {
+        "unguarded": base,
+        "handle": per_call(lambda: guarded(1, b=2)),
+    }
+
+    with unchecked():
+        results["handle (unchecked)"] = per_call(lambda: guarded(1, b=2))
+
+    results["faulthandler toggling"] = per_call(
+        lambda: faulthandler_toggling(1, b=2),
+    )
+
+    for name, ns in results.items():
+        print(f"{name:>24}: {ns:8.1f} ns/call ({ns - base:+.1f} ns)")
@@ -0,0 +1,53 @@
+"""Cold import time of `pointers`, as reported by `python -X importtime`."""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+RUNS = 10
+TOP = 10
+
+
+def import_times() -> Dict[str, List[int]]:
+    env = {**os.environ, "PYTHONPATH": os.path.join(os.getcwd(), "src")}
+    times: Dict[str, List[int]] = {}
+
+    for _ in range(RUNS):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import pointers"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+
+            self_us, cumulative_us, name = (
+                field.strip()
+                for field in line.partition(":")[2].split("|")
+            )
+            times.setdefault(name, []).append(int(self_us))
+            times.setdefault(f"{name} (cumulative)", []).append(
+                int(cumulative_us),
+            )
+
+    return times
+
+
+if __name__ == "__main__":
+    times = import_times()
+    total = statistics.median(times["pointers (cumulative)"])
+    print(f"import pointers: {total / 1000:.2f} ms (median of {RUNS})")
+
+    own = {
+        name: statistics.median(values)
+        for name, values in times.items()
+        if name.startswith("pointers") and not name.endswith("(cumulative)")
+    }
+
+    for name, us in sorted(own.items(), key=lambda i: -i[1])[:TOP]:
+        print(f"{name:>32}: {us / 1000:6.2f} ms self")
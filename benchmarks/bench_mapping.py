@@ -0,0 +1,31 @@
+"""Cost of mapping types to ctypes, and of `TypedCPointer.dereference`."""
+from timeit import timeit
+from typing import Callable
+
+from pointers import to_c_ptr
+from pointers._utils import get_mapped
+
+N = 200_000
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+def callback(a: int, b: float) -> int:
+    return a
+
+
+if __name__ == "__main__":
+    ptr = to_c_ptr(42)
+    fn_type = Callable[[int, float], int]
+    results = {
+        "get_mapped(int)": lambda: get_mapped(int),
+        "get_mapped(Callable)": lambda: get_mapped(fn_type),
+        "get_mapped(function)": lambda: get_mapped(callback),
+        "get_mapped(object)": lambda: get_mapped(object),
+        "TypedCPointer deref": lambda: ~ptr,
+    }
+
+    for name, stmt in results.items():
+        print(f"{name:>22}: {per_call(stmt):8.1f} ns/call")
@@ -0,0 +1,34 @@
+"""Time and peak memory of moving a large object into allocated memory."""
+import sys
+import tracemalloc
+from timeit import timeit
+
+from pointers import free, malloc
+
+SIZE = 16 * 1024 * 1024
+N = 20
+
+
+def traced_peak(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    data = bytes(SIZE)
+    ptr = malloc(sys.getsizeof(data))
+
+    def move():
+        ptr.move(data)
+
+    move()  # warm up any caches before measuring
+    per_move = timeit(move, number=N) / N
+    peak = traced_peak(move)
+    free(ptr)
+
+    print(f"object size: {sys.getsizeof(data) / 1024 / 1024:.1f} MiB")
+    print(f"   per move: {per_move * 1e3:.2f} ms")
+    print(f" peak alloc: {peak / 1024:.1f} KiB during one move")
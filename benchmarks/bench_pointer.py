@@ -0,0 +1,68 @@
+"""Creating object pointers: time per `to_ptr` call and memory per instance.
+
+Also compares building and walking N pointers one at a time against a
+`PointerArray`.
+"""
+import tracemalloc
+from timeit import timeit
+
+from pointers import _ as m
+from pointers import deref_many, to_ptr, to_ptrs
+
+N = 200_000
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+def per_instance(make) -> float:
+    values = list(range(N))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ptrs = make(values)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(ptrs) == N
+    return (after - before) / N
+
+
+def batch(stmt, number: int = 10) -> float:
+    return timeit(stmt, number=number) / number * 1e3
+
+
+if __name__ == "__main__":
+    value = "hello"
+    results = {
+        "to_ptr": lambda: to_ptr(value),
+        "m & value": lambda: m & value,
+        "~ptr": (lambda ptr: lambda: ~ptr)(to_ptr(value)),
+    }
+
+    for name, stmt in results.items():
+        print(f"{name:>18}: {per_call(stmt):8.1f} ns/call")
+
+    values = list(range(N))
+    makers = {
+        "list of to_ptr": lambda values: [to_ptr(i) for i in values],
+        "to_ptrs": to_ptrs,
+    }
+
+    for name, make in makers.items():
+        print(f"{name:>18}: {batch(lambda: make(values)):8.2f} ms", end=" ")
+        print(f"{per_instance(make):8.1f} bytes/pointer")
+
+    addresses = [id(i) for i in values]
+    elapsed = batch(lambda: deref_many(addresses))
+    print(f"{'deref_many':>18}: {elapsed:8.2f} ms")
+
+    pointers = [to_ptr(i) for i in values]
+    table = to_ptrs(values)
+    walks = {
+        "walk pointers": lambda: [~ptr for ptr in pointers],
+        "walk PointerArray": lambda: list(table),
+        "slice PointerArray": lambda: table[::2],
+    }
+
+    for name, walk in walks.items():
+        print(f"{name:>18}: {batch(walk):8.2f} ms")
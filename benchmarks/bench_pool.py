@@ -0,0 +1,37 @@
+"""Allocation churn through `malloc`/`free` compared to the pool allocator."""
+from timeit import timeit
+
+from pointers import Pool, free, malloc, pool_malloc
+
+N = 200_000
+SIZE = 28
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+def churn(alloc) -> None:
+    # a few live blocks at once, like a request handler would have
+    a = alloc()
+    b = alloc()
+    free(a)
+    c = alloc()
+    free(b)
+    free(c)
+
+
+if __name__ == "__main__":
+    pool = Pool(SIZE)
+    results = {
+        "malloc/free": per_call(lambda: churn(lambda: malloc(SIZE))),
+        "pool_malloc/free": per_call(lambda: churn(lambda: pool_malloc(SIZE))),
+        "Pool.allocate/free": per_call(lambda: churn(pool.allocate)),
+    }
+    base = results["malloc/free"]
+
+    for name, ns in results.items():
+        print(f"{name:>20}: {ns:8.1f} ns/iteration ({base / ns:.2f}x)")
+
+    print(f"{'utilization':>20}: {pool.utilization:.0%} of {pool.total_blocks} blocks")  # noqa
+    pool.close()
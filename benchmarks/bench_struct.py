@@ -0,0 +1,36 @@
+"""Reading and writing `Struct` fields, compared to plain ctypes fields."""
+from timeit import timeit
+
+from pointers import Struct, VoidPointer
+
+N = 500_000
+
+
+class Point(Struct):
+    x: int
+    y: int
+    name: bytes
+    data: VoidPointer
+
+
+def per_call(stmt) -> float:
+    return timeit(stmt, number=N) / N * 1e9
+
+
+if __name__ == "__main__":
+    point = Point(1, 2, b"origin", 0)
+    raw = point.struct
+
+    results = {
+        "ctypes field": lambda: raw.x,
+        "Struct field": lambda: point.x,
+        "Struct bytes field": lambda: point.name,
+        "Struct void* field": lambda: point.data,
+        "ctypes field write": lambda: setattr(raw, "x", 3),
+        "Struct field write": lambda: setattr(point, "x", 3),
+        "Struct(...)": lambda: Point(1, 2, b"origin", 0),
+        "from_existing": lambda: Point.from_existing(raw),
+    }
+
+    for name, stmt in results.items():
+        print(f"{name:>20}: {per_call(stmt):8.1f} ns/call")
@@ -1,5 +1,8 @@
+from contextvars import Token
 from types import FrameType
-from typing import Any, Callable, Type, TypeVar
+from typing import (
+    Any, Callable, Generic, Iterable, Iterator, Type, TypeVar, overload
+)
 
 _T = TypeVar("_T")
 _A = TypeVar("_A")
@@ -13,6 +16,49 @@ def handle(
     __args: tuple[Any, ...] | None = None,
     __kwargs: dict[str, Any] | None = None,
 ) -> _T: ...
+def set_segv_error(__typ: type[BaseException]) -> None: ...
+def set_null_error(__typ: type[BaseException]) -> None: ...
+def install_handler() -> None: ...
+def stop_handler() -> None: ...
+def enter_unchecked() -> Token[bool]: ...
+def exit_unchecked(__token: Token[bool]) -> None: ...
+
+class guarded(Generic[_T]):
+    def __init__(self, __func: Callable[..., _T]) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> _T: ...
+
+class buffer_exporter:
+    def _export_buffer(self) -> tuple[int, int, int, str, bool]: ...
+    def _release_buffer(self) -> None: ...
+
+class pointer_base:
+    _origin_size: int | None
+    def __init__(
+        self, address: int | None = None, increment_ref: bool = False
+    ) -> None: ...
+    @property
+    def address(self) -> int | None: ...
+    # also implements ~pointer, which subclasses type through Dereferencable
+    def dereference(self) -> Any: ...
+    def _point_to(self, __target: Any) -> None: ...
+    def _cleanup(self) -> None: ...
+
+class pointer_array:
+    def __init__(self, objects: Iterable[Any] = ...) -> None: ...
+    @property
+    def address(self) -> int: ...
+    @classmethod
+    def _from_addresses(
+        cls: Type[_A], __addresses: Iterable[int | None]
+    ) -> _A: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, __index: int) -> Any: ...
+    @overload
+    def __getitem__(self: _A, __index: slice) -> _A: ...
+    def __setitem__(self, __index: int | slice, __value: Any) -> None: ...
+    def __iter__(self) -> Iterator[Any]: ...
+
 def run_stack_callback(
     __size: int, __ptr: Type[_T], __func: Callable[[_T], _A]
 ) -> _A: ...
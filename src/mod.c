@@ -7,6 +7,12 @@ static inline PyObject* Py_NewRef(PyObject* ob) {
 }
 #endif
 
+#if PY_MINOR_VERSION < 9
+#define PyObject_Vectorcall _PyObject_Vectorcall
+#define PyObject_VectorcallDict _PyObject_FastCallDict
+#define Py_TPFLAGS_HAVE_VECTORCALL _Py_TPFLAGS_HAVE_VECTORCALL
+#endif
+
 #if PY_MAJOR_VERSION != 3
 #error "Python 3 is needed to build"
 #endif
@@ -18,10 +24,17 @@ static inline PyObject* Py_NewRef(PyObject* ob) {
 #define GET_LOCALS(frame) Py_NewRef(frame->f_locals);
 #endif
 #include <signal.h>
+#ifndef _WIN32
+#include <pthread.h>
+#endif
 #include <setjmp.h>
+#include <stdlib.h>
 #include <stdbool.h>
 #include <stdio.h>
+#include <stddef.h>
+#include <string.h>
 #include <frameobject.h>
+#include <structmember.h>
 #define GETOBJ() \
     PyObject* obj; if (!PyArg_ParseTuple(args, "O", &obj)) return NULL
 
@@ -39,7 +52,140 @@ static inline PyObject* Py_NewRef(PyObject* ob) {
     NULL; PyErr_SetString(PyExc_RuntimeError, "stack allocations are not supported on this system!"); return NULL;
 #endif
 
-static jmp_buf buf;
+#ifdef _MSC_VER
+#define THREAD_LOCAL __declspec(thread)
+#else
+#define THREAD_LOCAL __thread
+#endif
+
+#ifdef _WIN32
+#define JMP_BUF jmp_buf
+#define SETJMP(env) setjmp(env)
+#define LONGJMP(env, val) longjmp(env, val)
+#else
+#define JMP_BUF sigjmp_buf
+// the mask is fixed up by hand after a jump, saving it costs a syscall per call
+#define SETJMP(env) sigsetjmp(env, 0)
+#define LONGJMP(env, val) siglongjmp(env, val)
+#endif
+
+/*
+ * A guard is armed on the C stack for every call made through handle().
+ * Guards nest, so each one remembers the guard that was active before it,
+ * and each thread has its own chain since SIGSEGV is delivered to the thread
+ * that faulted.
+ *
+ * Jumping out of the signal handler skips every frame between the fault and
+ * handle(), so the parts of the thread state that those frames would have
+ * restored on their way out are saved here and put back by hand.
+ */
+typedef struct _guard {
+    JMP_BUF env;
+    struct _guard* previous;
+    PyThreadState* tstate;
+    _PyErr_StackItem* exc_info;
+#if PY_VERSION_HEX >= 0x030D0000
+    struct _PyInterpreterFrame* current_frame;
+#elif PY_VERSION_HEX >= 0x030A0000
+    void* cframe;
+#endif
+#if PY_VERSION_HEX < 0x030B0000
+    PyFrameObject* frame;
+    int recursion_depth;
+#elif PY_VERSION_HEX < 0x030C0000
+    int recursion_remaining;
+#else
+    int py_recursion_remaining;
+    int c_recursion_remaining;
+#endif
+#if PY_VERSION_HEX >= 0x030B0000
+    _PyStackChunk* datastack_chunk;
+    PyObject** datastack_top;
+    PyObject** datastack_limit;
+#endif
+} pointers_guard;
+
+static THREAD_LOCAL pointers_guard* current_guard = NULL;
+static PyObject* unchecked_var = NULL;
+static bool handler_installed = false;
+static volatile sig_atomic_t forwarding_fault = 0;
+static bool handler_enabled = true;
+static PyObject* segv_error = NULL;
+static PyObject* null_error = NULL;
+static const char* access_violation = "exception: access violation";
+#ifdef _WIN32
+static void (*previous_handler)(int) = SIG_DFL;
+#else
+static struct sigaction previous_handler;
+#endif
+
+static void save_thread_state(pointers_guard* guard, PyThreadState* tstate) {
+    guard->tstate = tstate;
+    guard->exc_info = tstate->exc_info;
+#if PY_VERSION_HEX >= 0x030D0000
+    guard->current_frame = tstate->current_frame;
+#elif PY_VERSION_HEX >= 0x030A0000
+    guard->cframe = tstate->cframe;
+#endif
+#if PY_VERSION_HEX < 0x030B0000
+    guard->frame = tstate->frame;
+    guard->recursion_depth = tstate->recursion_depth;
+#elif PY_VERSION_HEX < 0x030C0000
+    guard->recursion_remaining = tstate->recursion_remaining;
+#else
+    guard->py_recursion_remaining = tstate->py_recursion_remaining;
+    guard->c_recursion_remaining = tstate->c_recursion_remaining;
+#endif
+#if PY_VERSION_HEX >= 0x030B0000
+    guard->datastack_chunk = tstate->datastack_chunk;
+    guard->datastack_top = tstate->datastack_top;
+    guard->datastack_limit = tstate->datastack_limit;
+#endif
+}
+
+static void restore_thread_state(pointers_guard* guard) {
+    PyThreadState* tstate = guard->tstate;
+
+#ifndef _WIN32
+    // SIGSEGV is blocked while the handler runs, and we never returned from it
+    sigset_t segv;
+    sigemptyset(&segv);
+    sigaddset(
+        &segv,
+        SIGSEGV
+    );
+    pthread_sigmask(
+        SIG_UNBLOCK,
+        &segv,
+        NULL
+    );
+#endif
+
+    // the fault may have happened while the GIL was released (e.g. a ctypes call)
+    if (_PyThreadState_UncheckedGet() != tstate)
+        PyEval_RestoreThread(tstate);
+
+    tstate->exc_info = guard->exc_info;
+#if PY_VERSION_HEX >= 0x030D0000
+    tstate->current_frame = guard->current_frame;
+#elif PY_VERSION_HEX >= 0x030A0000
+    tstate->cframe = guard->cframe;
+#endif
+#if PY_VERSION_HEX < 0x030B0000
+    tstate->frame = guard->frame;
+    tstate->recursion_depth = guard->recursion_depth;
+#elif PY_VERSION_HEX < 0x030C0000
+    tstate->recursion_remaining = guard->recursion_remaining;
+#else
+    tstate->py_recursion_remaining = guard->py_recursion_remaining;
+    tstate->c_recursion_remaining = guard->c_recursion_remaining;
+#endif
+#if PY_VERSION_HEX >= 0x030B0000
+    tstate->datastack_chunk = guard->datastack_chunk;
+    tstate->datastack_top = guard->datastack_top;
+    tstate->datastack_limit = guard->datastack_limit;
+#endif
+}
 
 static PyObject* add_ref(PyObject* self, PyObject* args) {
     GETOBJ();
@@ -90,70 +236,1182 @@ static PyObject* force_set_attr(PyObject* self, PyObject* args) {
 }
 
 static void sigsegv_handler(int signum) {
-    longjmp(
-        buf,
+    pointers_guard* guard = current_guard;
+
+    if (guard) LONGJMP(
+        guard->env,
         1
     );
+
+    // not inside handle(), so give the fault to whoever had it before us
+    if (forwarding_fault) {
+        // the previous handler chained back to us, so just let it crash
+        signal(
+            SIGSEGV,
+            SIG_DFL
+        );
+        raise(signum);
+        return;
+    }
+    forwarding_fault = 1;
+#ifdef _WIN32
+    signal(
+        SIGSEGV,
+        previous_handler
+    );
+#else
+    sigaction(
+        SIGSEGV,
+        &previous_handler,
+        NULL
+    );
+#endif
+    raise(signum);
 }
 
+static int install_sigsegv_handler(void) {
+#ifdef _WIN32
+    void (*previous)(int) = signal(
+        SIGSEGV,
+        sigsegv_handler
+    );
+    if (previous == SIG_ERR) return -1;
+    if (previous != sigsegv_handler) previous_handler = previous;
+#else
+    struct sigaction action;
+    struct sigaction previous;
+    action.sa_handler = sigsegv_handler;
+    sigemptyset(&action.sa_mask);
+    action.sa_flags = SA_ONSTACK;
 
-static PyObject* handle(PyObject* self, PyObject* args) {
-    PyObject* func;
-    PyObject* params = NULL;
-    PyObject* kwargs = NULL;
+    if (sigaction(
+        SIGSEGV,
+        &action,
+        &previous
+        ) < 0) return -1;
+    if (previous.sa_handler != sigsegv_handler) previous_handler = previous;
+#endif
+    handler_installed = true;
+    return 0;
+}
+
+// faulthandler.enable() or signal.signal() may have replaced the handler
+// since it was installed, in which case it has to be taken back
+static int ensure_sigsegv_handler(void) {
+#ifndef _WIN32
+    struct sigaction current;
+
+    if (handler_installed) {
+        if (sigaction(
+            SIGSEGV,
+            NULL,
+            &current
+            ) < 0) return -1;
+        if (current.sa_handler == sigsegv_handler) return 0;
+    }
+#endif
+    return install_sigsegv_handler();
+}
+
+static PyObject* install_handler(PyObject* self, PyObject* args) {
+    if (install_sigsegv_handler() < 0) {
+        PyErr_SetString(
+            PyExc_RuntimeError,
+            "failed to setup SIGSEGV handler"
+        );
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject* stop_handler(PyObject* self, PyObject* args) {
+    handler_enabled = false;
+    Py_RETURN_NONE;
+}
+
+static PyObject* enter_unchecked(PyObject* self, PyObject* args) {
+    return PyContextVar_Set(unchecked_var, Py_True);
+}
+
+static PyObject* exit_unchecked(PyObject* self, PyObject* token) {
+    if (PyContextVar_Reset(unchecked_var, token) < 0) return NULL;
+    Py_RETURN_NONE;
+}
+
+static bool is_unchecked(void) {
+    PyObject* value;
+
+    // the variable is only ever set to True, and lookups are cached
+    if (PyContextVar_Get(unchecked_var, NULL, &value) < 0) {
+        PyErr_Clear();
+        return false;
+    }
+
+    Py_XDECREF(value);
+    return value != NULL;
+}
+
+static PyObject* set_segv_error(PyObject* self, PyObject* args) {
+    PyObject* tp;
 
     if (!PyArg_ParseTuple(
         args,
-        "O|O!O!",
-        &func,
-        &PyTuple_Type,
-        &params,
-        &PyDict_Type,
-        &kwargs
-    )
-    ) return NULL;
-
-    if (!params) params = PyTuple_New(0);
-    if (!kwargs) kwargs = PyDict_New();
-    int val = getenv("POINTERSPY_ALLOW_SEGV") ? 0 : setjmp(buf);
-
-    if (val) {
-        PyFrameObject* frame = PyEval_GetFrame();
-        PyObject* name;
-        PyCodeObject* code = NULL;
-        puts("1");
-        if (frame) {
-            code = GET_CODE(frame);
-            name = Py_NewRef(code->co_name);
-        } else {
-            name = PyObject_GetAttrString(
-                func,
-                "__name__"
-            );
-        }
-        puts("2");
+        "O!",
+        &PyType_Type,
+        &tp
+        )) return NULL;
 
-        Py_DECREF(frame);
+    Py_XSETREF(
+        segv_error,
+        Py_NewRef(tp)
+    );
+    Py_RETURN_NONE;
+}
 
-        PyErr_Format(
+static PyObject* set_null_error(PyObject* self, PyObject* args) {
+    PyObject* tp;
+
+    if (!PyArg_ParseTuple(
+        args,
+        "O!",
+        &PyType_Type,
+        &tp
+        )) return NULL;
+
+    Py_XSETREF(
+        null_error,
+        Py_NewRef(tp)
+    );
+    Py_RETURN_NONE;
+}
+
+static PyObject* segv_error_type(void) {
+    return segv_error ? segv_error : PyExc_RuntimeError;
+}
+
+// ctypes reports faults in foreign calls on windows as an OSError
+static void convert_access_violation(void) {
+    PyObject* type;
+    PyObject* value;
+    PyObject* tb;
+    PyErr_Fetch(
+        &type,
+        &value,
+        &tb
+    );
+    PyErr_NormalizeException(
+        &type,
+        &value,
+        &tb
+    );
+
+    PyObject* msg = value ? PyObject_Str(value) : NULL;
+    const char* str = msg ? PyUnicode_AsUTF8(msg) : NULL;
+    if (str && !strncmp(
+        str,
+        access_violation,
+        strlen(access_violation)
+        )) {
+        Py_XDECREF(type);
+        Py_XDECREF(value);
+        Py_XDECREF(tb);
+        PyErr_SetObject(
+            segv_error_type(),
+            msg
+        );
+        Py_DECREF(msg);
+        return;
+    }
+
+    Py_XDECREF(msg);
+    PyErr_Restore(
+        type,
+        value,
+        tb
+    );
+}
+
+static PyObject* guarded_call(
+    PyObject* func,
+    PyObject* const* args,
+    size_t nargsf,
+    PyObject* kwnames,
+    PyObject* kwargs
+) {
+    PyObject* result;
+
+    if (!handler_enabled || is_unchecked()) {
+        if (kwargs) return PyObject_VectorcallDict(
+            func,
+            args,
+            PyVectorcall_NARGS(nargsf),
+            kwargs
+        );
+        return PyObject_Vectorcall(
+            func,
+            args,
+            nargsf,
+            kwnames
+        );
+    }
+
+    // nested calls were already checked by the outermost one
+    if (!current_guard && (ensure_sigsegv_handler() < 0)) {
+        PyErr_SetString(
             PyExc_RuntimeError,
+            "failed to setup SIGSEGV handler"
+        );
+        return NULL;
+    }
+
+    pointers_guard guard;
+    guard.previous = current_guard;
+    save_thread_state(
+        &guard,
+        PyThreadState_Get()
+    );
+
+    if (SETJMP(guard.env)) {
+        current_guard = guard.previous;
+        restore_thread_state(&guard);
+        PyObject* name = PyObject_GetAttrString(
+            func,
+            "__name__"
+        );
+
+        if (!name) {
+            PyErr_Clear();
+            name = PyObject_Repr(func);
+            if (!name) return NULL;
+        }
+
+        PyErr_Format(
+            segv_error_type(),
             "segment violation occured during execution of %S",
             name
         );
+        Py_DECREF(name);
+        return NULL;
+    }
+
+    current_guard = &guard;
+    if (kwargs) result = PyObject_VectorcallDict(
+        func,
+        args,
+        PyVectorcall_NARGS(nargsf),
+        kwargs
+    );
+    else result = PyObject_Vectorcall(
+        func,
+        args,
+        nargsf,
+        kwnames
+    );
+    current_guard = guard.previous;
 
-        if (code) Py_DECREF(code);
+    if (!result && PyErr_ExceptionMatches(PyExc_OSError))
+        convert_access_violation();
+
+    return result;
+}
+
+static PyObject* handle(
+    PyObject* self,
+    PyObject* const* args,
+    Py_ssize_t nargs
+) {
+    if ((nargs < 1) || (nargs > 3)) {
+        PyErr_Format(
+            PyExc_TypeError,
+            "handle expected 1 to 3 arguments, got %zd",
+            nargs
+        );
         return NULL;
     }
 
-    PyObject* result = PyObject_Call(
+    PyObject* func = args[0];
+    PyObject* params = (nargs > 1) && (args[1] != Py_None) ? args[1] : NULL;
+    PyObject* kwargs = (nargs > 2) && (args[2] != Py_None) ? args[2] : NULL;
+
+    if (params && !PyTuple_Check(params)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "handle arguments must be a tuple"
+        );
+        return NULL;
+    }
+
+    if (kwargs && !PyDict_Check(kwargs)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "handle keyword arguments must be a dict"
+        );
+        return NULL;
+    }
+
+    if (kwargs && !PyDict_GET_SIZE(kwargs)) kwargs = NULL;
+
+    return guarded_call(
         func,
-        params,
+        params ? &PyTuple_GET_ITEM(
+            params,
+            0
+        ) : NULL,
+        params ? PyTuple_GET_SIZE(params) : 0,
+        NULL,
         kwargs
     );
+}
+
+typedef struct {
+    PyObject_HEAD
+    PyObject* func;
+    PyObject* dict;
+    vectorcallfunc vectorcall;
+} GuardedObject;
+
+static PyObject* guarded_vectorcall(
+    PyObject* self,
+    PyObject* const* args,
+    size_t nargsf,
+    PyObject* kwnames
+) {
+    return guarded_call(
+        ((GuardedObject*) self)->func,
+        args,
+        nargsf,
+        kwnames,
+        NULL
+    );
+}
+
+static PyObject* guarded_new(
+    PyTypeObject* type,
+    PyObject* args,
+    PyObject* kwargs
+) {
+    PyObject* func;
+
+    if (!PyArg_ParseTuple(
+        args,
+        "O",
+        &func
+        )) return NULL;
+
+    if (!PyCallable_Check(func)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "guarded object must be callable"
+        );
+        return NULL;
+    }
+
+    GuardedObject* self = (GuardedObject*) type->tp_alloc(
+        type,
+        0
+    );
+    if (!self) return NULL;
+
+    self->func = Py_NewRef(func);
+    self->dict = NULL;
+    self->vectorcall = guarded_vectorcall;
+    return (PyObject*) self;
+}
+
+static int guarded_traverse(
+    GuardedObject* self,
+    visitproc visit,
+    void* arg
+) {
+    Py_VISIT(self->func);
+    Py_VISIT(self->dict);
+    return 0;
+}
+
+static int guarded_clear(GuardedObject* self) {
+    Py_CLEAR(self->func);
+    Py_CLEAR(self->dict);
+    return 0;
+}
+
+static void guarded_dealloc(GuardedObject* self) {
+    PyObject_GC_UnTrack(self);
+    guarded_clear(self);
+    Py_TYPE(self)->tp_free((PyObject*) self);
+}
+
+// behave like a function when stored on a class
+static PyObject* guarded_descr_get(
+    PyObject* self,
+    PyObject* obj,
+    PyObject* type
+) {
+    if (!obj || (obj == Py_None)) return Py_NewRef(self);
+    return PyMethod_New(
+        self,
+        obj
+    );
+}
+
+static PyGetSetDef guarded_getset[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {NULL}
+};
+
+static PyTypeObject GuardedType = {
+    PyVarObject_HEAD_INIT(
+        NULL,
+        0
+    )
+    .tp_name = "_pointers.guarded",
+    .tp_doc = "Function that runs with the SIGSEGV handler enabled.",
+    .tp_basicsize = sizeof(GuardedObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+                Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_new = guarded_new,
+    .tp_dealloc = (destructor) guarded_dealloc,
+    .tp_traverse = (traverseproc) guarded_traverse,
+    .tp_clear = (inquiry) guarded_clear,
+    .tp_call = PyVectorcall_Call,
+    .tp_descr_get = guarded_descr_get,
+    .tp_vectorcall_offset = offsetof(
+        GuardedObject,
+        vectorcall
+    ),
+    .tp_dictoffset = offsetof(
+        GuardedObject,
+        dict
+    ),
+    .tp_getset = guarded_getset,
+};
+
+typedef struct {
+    Py_ssize_t shape;
+    Py_ssize_t stride;
+    char format[32];
+} BufferInternal;
+
+static void release_export(PyObject* self) {
+    PyObject* res = PyObject_CallMethod(
+        self,
+        "_release_buffer",
+        NULL
+    );
+
+    if (!res) PyErr_WriteUnraisable(self);
+    Py_XDECREF(res);
+}
+
+static int exporter_getbuffer(
+    PyObject* self,
+    Py_buffer* view,
+    int flags
+) {
+    // (address, length, itemsize, format, readonly), counted as an export
+    PyObject* info = PyObject_CallMethod(
+        self,
+        "_export_buffer",
+        NULL
+    );
+    if (!info) return -1;
+
+    PyObject* address;
+    Py_ssize_t length;
+    Py_ssize_t itemsize;
+    const char* format;
+    int readonly;
+
+    if (!PyArg_ParseTuple(
+        info,
+        "Onnsp;_export_buffer() must return "
+        "(address, length, itemsize, format, readonly)",
+        &address,
+        &length,
+        &itemsize,
+        &format,
+        &readonly
+        )) goto error;
+
+    void* buf = PyLong_AsVoidPtr(address);
+    if (!buf && PyErr_Occurred()) goto error;
+
+    if (((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE) && readonly) {
+        PyErr_SetString(
+            PyExc_BufferError,
+            "buffer is read-only"
+        );
+        goto error;
+    }
+
+    if (strlen(format) >= sizeof(((BufferInternal*) NULL)->format)) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "buffer format %s is too long",
+            format
+        );
+        goto error;
+    }
+
+    BufferInternal* internal = PyMem_Malloc(sizeof(BufferInternal));
+    if (!internal) {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    internal->shape = length;
+    internal->stride = itemsize;
+    strcpy(
+        internal->format,
+        format
+    );
+
+    view->buf = buf;
+    view->obj = Py_NewRef(self);
+    view->len = length * itemsize;
+    view->readonly = readonly;
+    view->itemsize = itemsize;
+    view->format = (flags & PyBUF_FORMAT) ? internal->format : NULL;
+    view->ndim = 1;
+    view->shape = ((flags & PyBUF_ND) == PyBUF_ND) ? &internal->shape : NULL;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ?
+                    &internal->stride : NULL;
+    view->suboffsets = NULL;
+    view->internal = internal;
+
+    Py_DECREF(info);
+    return 0;
+
+error:
+    Py_DECREF(info);
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    release_export(self);
+    PyErr_Restore(type, value, traceback);
+    view->obj = NULL;
+    return -1;
+}
+
+static void exporter_releasebuffer(PyObject* self, Py_buffer* view) {
+    PyMem_Free(view->internal);
+    release_export(self);
+}
+
+static PyBufferProcs exporter_as_buffer = {
+    .bf_getbuffer = exporter_getbuffer,
+    .bf_releasebuffer = exporter_releasebuffer,
+};
+
+static PyTypeObject BufferExporterType = {
+    PyVarObject_HEAD_INIT(
+        NULL,
+        0
+    )
+    .tp_name = "_pointers.buffer_exporter",
+    .tp_doc = "Base class exporting memory described by _export_buffer().",
+    .tp_basicsize = sizeof(PyObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    .tp_as_buffer = &exporter_as_buffer,
+};
+
+static PyObject* null_pointer_error(void) {
+    PyErr_SetString(
+        null_error ? null_error : PyExc_RuntimeError,
+        "pointer is NULL"
+    );
+    return NULL;
+}
+
+/*
+ * Object pointers hold a strong reference to their target, so dereferencing
+ * is just handing that reference back. The reference is released when the
+ * pointer is reassigned, cleaned up or deallocated.
+ */
+typedef struct {
+    PyObject_HEAD
+    PyObject* target;
+    PyObject* origin_size;
+} PointerObject;
+
+static int pointer_init(
+    PointerObject* self,
+    PyObject* args,
+    PyObject* kwargs
+) {
+    static char* kwlist[] = {"address", "increment_ref", NULL};
+    PyObject* address = Py_None;
+    int increment_ref = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(
+        args,
+        kwargs,
+        "|Op",
+        kwlist,
+        &address,
+        &increment_ref
+        )) return -1;
+
+    PyObject* target = NULL;
+
+    if (address != Py_None) {
+        target = PyLong_AsVoidPtr(address);
+        if (!target && PyErr_Occurred()) return -1;
+    }
+
+    // without increment_ref, the caller hands over a reference it already owns
+    if (target && increment_ref) Py_INCREF(target);
+    Py_XSETREF(
+        self->target,
+        target
+    );
+    Py_CLEAR(self->origin_size);
+    return 0;
+}
+
+static int pointer_traverse(
+    PointerObject* self,
+    visitproc visit,
+    void* arg
+) {
+    Py_VISIT(self->target);
+    return 0;
+}
+
+static int pointer_clear(PointerObject* self) {
+    Py_CLEAR(self->target);
+    Py_CLEAR(self->origin_size);
+    return 0;
+}
+
+static void pointer_dealloc(PointerObject* self) {
+    PyObject_GC_UnTrack(self);
+    pointer_clear(self);
+    Py_TYPE(self)->tp_free((PyObject*) self);
+}
+
+static PyObject* pointer_dereference(PyObject* self, PyObject* args) {
+    PyObject* target = ((PointerObject*) self)->target;
+
+    if (!target) return null_pointer_error();
+    return Py_NewRef(target);
+}
+
+static PyObject* pointer_invert(PyObject* self) {
+    return pointer_dereference(
+        self,
+        NULL
+    );
+}
+
+// the origin size outlives reassignment, so moves keep checking against it
+static PyObject* pointer_point_to(PointerObject* self, PyObject* target) {
+    Py_XSETREF(
+        self->target,
+        Py_NewRef(target)
+    );
+    Py_RETURN_NONE;
+}
+
+static PyObject* pointer_cleanup(PointerObject* self, PyObject* args) {
+    Py_CLEAR(self->target);
+    Py_RETURN_NONE;
+}
+
+static PyObject* pointer_get_address(PointerObject* self, void* closure) {
+    if (!self->target) Py_RETURN_NONE;
+    return PyLong_FromVoidPtr(self->target);
+}
+
+static PyMethodDef pointer_methods[] = {
+    {"dereference", pointer_dereference, METH_NOARGS,
+     "Dereference the pointer."},
+    {"_point_to", (PyCFunction) pointer_point_to, METH_O,
+     "Release the current target and take a reference to a new one."},
+    {"_cleanup", (PyCFunction) pointer_cleanup, METH_NOARGS,
+     "Release the reference to the target, making the pointer NULL."},
+    {NULL}
+};
+
+static PyMemberDef pointer_members[] = {
+    {"_origin_size", T_OBJECT, offsetof(PointerObject, origin_size), 0,
+     "Size of the target before anything was moved into it."},
+    {NULL}
+};
+
+static PyGetSetDef pointer_getset[] = {
+    {"address", (getter) pointer_get_address, NULL,
+     "Address that the pointer is looking at.", NULL},
+    {NULL}
+};
+
+static PyNumberMethods pointer_as_number = {
+    .nb_invert = pointer_invert,
+};
+
+static PyTypeObject PointerBaseType = {
+    PyVarObject_HEAD_INIT(
+        NULL,
+        0
+    )
+    .tp_name = "_pointers.pointer_base",
+    .tp_doc = "Base class for a pointer owning a reference to a Python object.",
+    .tp_basicsize = sizeof(PointerObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .tp_init = (initproc) pointer_init,
+    .tp_dealloc = (destructor) pointer_dealloc,
+    .tp_traverse = (traverseproc) pointer_traverse,
+    .tp_clear = (inquiry) pointer_clear,
+    .tp_methods = pointer_methods,
+    .tp_members = pointer_members,
+    .tp_getset = pointer_getset,
+    .tp_as_number = &pointer_as_number,
+};
+
+/*
+ * A contiguous block of PyObject* slots, each owning a strong reference (or
+ * NULL). Items are only turned back into objects when they are accessed.
+ */
+typedef struct {
+    PyObject_HEAD
+    PyObject** items;
+    Py_ssize_t length;
+} PointerArrayObject;
+
+static PointerArrayObject* pointer_array_alloc(
+    PyTypeObject* type,
+    Py_ssize_t length
+) {
+    PointerArrayObject* self = (PointerArrayObject*) type->tp_alloc(
+        type,
+        0
+    );
+    if (!self) return NULL;
+
+    // at least one slot, so an empty array still has an address
+    self->items = PyMem_Calloc(
+        length ? length : 1,
+        sizeof(PyObject*)
+    );
+    if (!self->items) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    self->length = length;
+    return self;
+}
+
+static PyObject* pointer_array_from_objects(
+    PyTypeObject* type,
+    PyObject* iterable
+) {
+    if (!iterable) return (PyObject*) pointer_array_alloc(
+        type,
+        0
+    );
+
+    PyObject* seq = PySequence_Fast(
+        iterable,
+        "expected an iterable of objects"
+    );
+    if (!seq) return NULL;
+
+    Py_ssize_t length = PySequence_Fast_GET_SIZE(seq);
+    PointerArrayObject* self = pointer_array_alloc(
+        type,
+        length
+    );
+
+    if (self) {
+        PyObject** objects = PySequence_Fast_ITEMS(seq);
+        for (Py_ssize_t i = 0; i < length; i++)
+            self->items[i] = Py_NewRef(objects[i]);
+    }
+
+    Py_DECREF(seq);
+    return (PyObject*) self;
+}
+
+static PyObject* pointer_array_from_addresses(
+    PyTypeObject* type,
+    PyObject* iterable
+) {
+    PyObject* seq = PySequence_Fast(
+        iterable,
+        "expected an iterable of addresses"
+    );
+    if (!seq) return NULL;
+
+    Py_ssize_t length = PySequence_Fast_GET_SIZE(seq);
+    PointerArrayObject* self = pointer_array_alloc(
+        type,
+        length
+    );
+    if (!self) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+
+    PyObject** addresses = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < length; i++) {
+        if (addresses[i] == Py_None) continue;
+
+        PyObject* target = PyLong_AsVoidPtr(addresses[i]);
+        if (!target && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            Py_DECREF(self);
+            return NULL;
+        }
+
+        Py_XINCREF(target);
+        self->items[i] = target;
+    }
+
+    Py_DECREF(seq);
+    return (PyObject*) self;
+}
+
+static PyObject* pointer_array_new(
+    PyTypeObject* type,
+    PyObject* args,
+    PyObject* kwargs
+) {
+    static char* kwlist[] = {"objects", NULL};
+    PyObject* objects = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(
+        args,
+        kwargs,
+        "|O",
+        kwlist,
+        &objects
+        )) return NULL;
+
+    return pointer_array_from_objects(
+        type,
+        objects
+    );
+}
+
+static int pointer_array_traverse(
+    PointerArrayObject* self,
+    visitproc visit,
+    void* arg
+) {
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        Py_VISIT(self->items[i]);
+    return 0;
+}
+
+static int pointer_array_clear(PointerArrayObject* self) {
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        Py_CLEAR(self->items[i]);
+    return 0;
+}
+
+static void pointer_array_dealloc(PointerArrayObject* self) {
+    PyObject_GC_UnTrack(self);
+    if (self->items) {
+        pointer_array_clear(self);
+        PyMem_Free(self->items);
+        self->items = NULL;
+    }
+    Py_TYPE(self)->tp_free((PyObject*) self);
+}
+
+static Py_ssize_t pointer_array_length(PointerArrayObject* self) {
+    return self->length;
+}
+
+static PyObject* pointer_array_item(
+    PointerArrayObject* self,
+    Py_ssize_t index
+) {
+    if ((index < 0) || (index >= self->length)) {
+        PyErr_SetString(
+            PyExc_IndexError,
+            "pointer array index out of range"
+        );
+        return NULL;
+    }
+
+    PyObject* target = self->items[index];
+    if (!target) return null_pointer_error();
+    return Py_NewRef(target);
+}
+
+static int pointer_array_index(
+    PointerArrayObject* self,
+    PyObject* key,
+    Py_ssize_t* index
+) {
+    Py_ssize_t i = PyNumber_AsSsize_t(
+        key,
+        PyExc_IndexError
+    );
+    if ((i == -1) && PyErr_Occurred()) return -1;
+    if (i < 0) i += self->length;
+
+    if ((i < 0) || (i >= self->length)) {
+        PyErr_SetString(
+            PyExc_IndexError,
+            "pointer array index out of range"
+        );
+        return -1;
+    }
+
+    *index = i;
+    return 0;
+}
+
+static PyObject* pointer_array_subscript(
+    PointerArrayObject* self,
+    PyObject* key
+) {
+    if (!PySlice_Check(key)) {
+        if (!PyIndex_Check(key)) {
+            PyErr_Format(
+                PyExc_TypeError,
+                "pointer array indices must be integers or slices, not %.200s",
+                Py_TYPE(key)->tp_name
+            );
+            return NULL;
+        }
+
+        Py_ssize_t index;
+        if (pointer_array_index(
+            self,
+            key,
+            &index
+            ) < 0) return NULL;
+        return pointer_array_item(
+            self,
+            index
+        );
+    }
+
+    Py_ssize_t start, stop, step;
+    if (PySlice_Unpack(
+        key,
+        &start,
+        &stop,
+        &step
+        ) < 0) return NULL;
+
+    Py_ssize_t length = PySlice_AdjustIndices(
+        self->length,
+        &start,
+        &stop,
+        step
+    );
+    PointerArrayObject* result = pointer_array_alloc(
+        Py_TYPE(self),
+        length
+    );
     if (!result) return NULL;
-    return result;
+
+    for (Py_ssize_t i = 0; i < length; i++) {
+        PyObject* target = self->items[start + i * step];
+        Py_XINCREF(target);
+        result->items[i] = target;
+    }
+
+    return (PyObject*) result;
+}
+
+static int pointer_array_ass_subscript(
+    PointerArrayObject* self,
+    PyObject* key,
+    PyObject* value
+) {
+    if (!value) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "pointer array items cannot be deleted"
+        );
+        return -1;
+    }
+
+    if (!PySlice_Check(key)) {
+        if (!PyIndex_Check(key)) {
+            PyErr_Format(
+                PyExc_TypeError,
+                "pointer array indices must be integers or slices, not %.200s",
+                Py_TYPE(key)->tp_name
+            );
+            return -1;
+        }
+
+        Py_ssize_t index;
+        if (pointer_array_index(
+            self,
+            key,
+            &index
+            ) < 0) return -1;
+
+        Py_XSETREF(
+            self->items[index],
+            Py_NewRef(value)
+        );
+        return 0;
+    }
+
+    Py_ssize_t start, stop, step;
+    if (PySlice_Unpack(
+        key,
+        &start,
+        &stop,
+        &step
+        ) < 0) return -1;
+
+    Py_ssize_t length = PySlice_AdjustIndices(
+        self->length,
+        &start,
+        &stop,
+        step
+    );
+    PyObject* seq = PySequence_Fast(
+        value,
+        "can only assign an iterable to a pointer array slice"
+    );
+    if (!seq) return -1;
+
+    if (PySequence_Fast_GET_SIZE(seq) != length) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "cannot assign %zd items to a slice of length %zd",
+            PySequence_Fast_GET_SIZE(seq),
+            length
+        );
+        Py_DECREF(seq);
+        return -1;
+    }
+
+    PyObject** objects = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < length; i++)
+        Py_XSETREF(
+            self->items[start + i * step],
+            Py_NewRef(objects[i])
+        );
+
+    Py_DECREF(seq);
+    return 0;
+}
+
+static PyObject* pointer_array_get_address(
+    PointerArrayObject* self,
+    void* closure
+) {
+    return PyLong_FromVoidPtr(self->items);
+}
+
+typedef struct {
+    PyObject_HEAD
+    PointerArrayObject* array;
+    Py_ssize_t index;
+} PointerArrayIterObject;
+
+static PyTypeObject PointerArrayIterType;
+
+static PyObject* pointer_array_iter(PointerArrayObject* self) {
+    PointerArrayIterObject* it = PyObject_GC_New(
+        PointerArrayIterObject,
+        &PointerArrayIterType
+    );
+    if (!it) return NULL;
+
+    it->array = (PointerArrayObject*) Py_NewRef((PyObject*) self);
+    it->index = 0;
+    PyObject_GC_Track(it);
+    return (PyObject*) it;
+}
+
+static PyObject* pointer_array_iter_next(PointerArrayIterObject* it) {
+    PointerArrayObject* array = it->array;
+    if (!array) return NULL;
+
+    if (it->index < array->length) return pointer_array_item(
+        array,
+        it->index++
+    );
+
+    Py_CLEAR(it->array);
+    return NULL;
+}
+
+static int pointer_array_iter_traverse(
+    PointerArrayIterObject* it,
+    visitproc visit,
+    void* arg
+) {
+    Py_VISIT(it->array);
+    return 0;
+}
+
+static void pointer_array_iter_dealloc(PointerArrayIterObject* it) {
+    PyObject_GC_UnTrack(it);
+    Py_XDECREF(it->array);
+    PyObject_GC_Del(it);
 }
 
+static PyTypeObject PointerArrayIterType = {
+    PyVarObject_HEAD_INIT(
+        NULL,
+        0
+    )
+    .tp_name = "_pointers.pointer_array_iterator",
+    .tp_basicsize = sizeof(PointerArrayIterObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_dealloc = (destructor) pointer_array_iter_dealloc,
+    .tp_traverse = (traverseproc) pointer_array_iter_traverse,
+    .tp_iter = PyObject_SelfIter,
+    .tp_iternext = (iternextfunc) pointer_array_iter_next,
+};
+
+static PyMethodDef pointer_array_methods[] = {
+    {"_from_addresses", (PyCFunction) pointer_array_from_addresses,
+     METH_O | METH_CLASS,
+     "Create an array holding a reference to the object at every address."},
+    {NULL}
+};
+
+static PyGetSetDef pointer_array_getset[] = {
+    {"address", (getter) pointer_array_get_address, NULL,
+     "Address of the first item.", NULL},
+    {NULL}
+};
+
+static PySequenceMethods pointer_array_as_sequence = {
+    .sq_length = (lenfunc) pointer_array_length,
+    .sq_item = (ssizeargfunc) pointer_array_item,
+};
+
+static PyMappingMethods pointer_array_as_mapping = {
+    .mp_length = (lenfunc) pointer_array_length,
+    .mp_subscript = (binaryfunc) pointer_array_subscript,
+    .mp_ass_subscript = (objobjargproc) pointer_array_ass_subscript,
+};
+
+static PyTypeObject PointerArrayType = {
+    PyVarObject_HEAD_INIT(
+        NULL,
+        0
+    )
+    .tp_name = "_pointers.pointer_array",
+    .tp_doc = "Contiguous array of owned references to Python objects.",
+    .tp_basicsize = sizeof(PointerArrayObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .tp_dealloc = (destructor) pointer_array_dealloc,
+    .tp_traverse = (traverseproc) pointer_array_traverse,
+    .tp_clear = (inquiry) pointer_array_clear,
+    .tp_new = pointer_array_new,
+    .tp_iter = (getiterfunc) pointer_array_iter,
+    .tp_methods = pointer_array_methods,
+    .tp_getset = pointer_array_getset,
+    .tp_as_sequence = &pointer_array_as_sequence,
+    .tp_as_mapping = &pointer_array_as_mapping,
+};
+
 static PyObject* run_stack_callback(PyObject* self, PyObject* args) {
     int size;
     PyObject* tp;
@@ -248,7 +1506,20 @@ static PyMethodDef methods[] = {
      "Force setting an attribute on the target type."},
     {"set_ref", set_ref, METH_VARARGS,
      "Set the reference count on the target object."},
-    {"handle", handle, METH_VARARGS, "Enable the SIGSEGV handler."},
+    {"handle", (PyCFunction) handle, METH_FASTCALL,
+     "Call a function with the SIGSEGV handler enabled."},
+    {"set_segv_error", set_segv_error, METH_VARARGS,
+     "Set the exception raised when a segment violation occurs."},
+    {"set_null_error", set_null_error, METH_VARARGS,
+     "Set the exception raised when dereferencing a NULL pointer."},
+    {"install_handler", install_handler, METH_NOARGS,
+     "Install the SIGSEGV handler over the current one."},
+    {"stop_handler", stop_handler, METH_NOARGS,
+     "Shutoff the SIGSEGV handler."},
+    {"enter_unchecked", enter_unchecked, METH_NOARGS,
+     "Skip the SIGSEGV handler in the current context."},
+    {"exit_unchecked", exit_unchecked, METH_O,
+     "Undo the call to enter_unchecked that returned the given token."},
     {"run_stack_callback", run_stack_callback, METH_VARARGS,
      "Run a callback with a stack allocated pointer."},
     {"force_update_locals", force_update_locals, METH_VARARGS,
@@ -281,16 +1552,75 @@ PyMODINIT_FUNC PyInit__pointers(void) {
         );
         return NULL;
     };
-    if (signal(
-        SIGSEGV,
-        sigsegv_handler
-        ) == SIG_ERR) {
-        PyErr_SetString(
-            PyExc_ImportError,
-            "cant load _pointers: failed to setup SIGSEGV handler"
-        );
+
+    // the environment is only checked once, stop_handler() covers the rest
+    if (getenv("POINTERSPY_ALLOW_SEGV")) handler_enabled = false;
+
+    if (PyType_Ready(&GuardedType) < 0) return NULL;
+    // subclasses go through object.__new__ for their abstract method checks,
+    // and Python code calling super().__new__ should find object.__new__ too
+    BufferExporterType.tp_new = PyBaseObject_Type.tp_new;
+    if (PyType_Ready(&BufferExporterType) < 0) return NULL;
+    if (PyDict_DelItemString(
+        BufferExporterType.tp_dict,
+        "__new__"
+        ) < 0) return NULL;
+    PyType_Modified(&BufferExporterType);
+    PointerBaseType.tp_new = PyBaseObject_Type.tp_new;
+    if (PyType_Ready(&PointerBaseType) < 0) return NULL;
+    if (PyDict_DelItemString(
+        PointerBaseType.tp_dict,
+        "__new__"
+        ) < 0) return NULL;
+    PyType_Modified(&PointerBaseType);
+    if (PyType_Ready(&PointerArrayType) < 0) return NULL;
+    if (PyType_Ready(&PointerArrayIterType) < 0) return NULL;
+    if (!unchecked_var) {
+        unchecked_var = PyContextVar_New("pointers.unchecked", NULL);
+        if (!unchecked_var) return NULL;
+    }
+    PyObject* mod = PyModule_Create(&module);
+    if (!mod) return NULL;
+
+    if (PyModule_AddObject(
+        mod,
+        "guarded",
+        Py_NewRef((PyObject*) &GuardedType)
+        ) < 0) {
+        Py_DECREF(&GuardedType);
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    if (PyModule_AddObject(
+        mod,
+        "buffer_exporter",
+        Py_NewRef((PyObject*) &BufferExporterType)
+        ) < 0) {
+        Py_DECREF(&BufferExporterType);
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    if (PyModule_AddObject(
+        mod,
+        "pointer_base",
+        Py_NewRef((PyObject*) &PointerBaseType)
+        ) < 0) {
+        Py_DECREF(&PointerBaseType);
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    if (PyModule_AddObject(
+        mod,
+        "pointer_array",
+        Py_NewRef((PyObject*) &PointerArrayType)
+        ) < 0) {
+        Py_DECREF(&PointerArrayType);
+        Py_DECREF(mod);
         return NULL;
     }
 
-    return PyModule_Create(&module);
+    return mod;
 }
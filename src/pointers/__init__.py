@@ -4,20 +4,20 @@ if __import__("sys").implementation.name != "cpython":
         "pointers.py is only supported on cpython",
     )
 
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
 from ._utils import force_set_attr
-from .api_bindings import *
+from .arena import Arena
 from .base_pointers import (
     BaseAllocatedPointer, BaseCPointer, BaseObjectPointer, BasePointer,
     BasicPointer, Dereferencable, IterDereferencable, Sized
 )
-from .bindings import *
 from .c_pointer import (
-    TypedCPointer, VoidPointer, array, cast, to_c_ptr, to_func_ptr,
-    to_struct_ptr, to_voidp
+    TypedCPointer, VoidPointer, array, array_from, cast, to_c_ptr,
+    to_func_ptr, to_struct_ptr, to_voidp
 )
 from .calloc import AllocatedArrayPointer, calloc
-from .custom_binding import binding, binds
-from .decay import decay, decay_annotated, decay_wrapped
 from .exceptions import (
     AllocationError, DereferenceError, FreedMemoryError,
     InvalidBindingParameter, InvalidSizeError, NullPointerError,
@@ -25,14 +25,146 @@ from .exceptions import (
 )
 from .magic import _
 from .malloc import AllocatedPointer, free, malloc, realloc
-from .object_pointer import Pointer, to_ptr
+from .ndarray import array_from_ndarray
+from .object_pointer import (
+    Pointer, PointerArray, deref_many, to_ptr, to_ptrs
+)
+from .pool import Pool, pool_malloc
 from .stack_pointer import (
     StackAllocatedPointer, acquire_stack_alloc, stack_alloc
 )
-from .std_structs import DivT, Lconv, LDivT, Tm
-from .structure import Struct, StructPointer
-from .util import NULL, Nullable, handle, raw_type, struct_cast, stop_handler
-from .var_pointer import VarPointer, to_var_ptr
+from .util import (
+    NULL, Nullable, handle, raw_type, stop_handler, struct_cast, unchecked
+)
+
+if _TYPE_CHECKING:
+    from .api_bindings import *
+    from .bindings import *
+    from .custom_binding import binding, binds
+    from .decay import decay, decay_annotated, decay_wrapped
+    from .std_structs import DivT, Lconv, LDivT, Tm
+    from .structure import Struct, StructArray, StructPointer, StructRecord
+    from .var_pointer import VarPointer, to_var_ptr
+
+# the heavier submodules are only imported once one of their names is used
+_LAZY_NAMES = {
+    "binding": "custom_binding",
+    "binds": "custom_binding",
+    "decay": "decay",
+    "decay_annotated": "decay",
+    "decay_wrapped": "decay",
+    "DivT": "std_structs",
+    "Lconv": "std_structs",
+    "LDivT": "std_structs",
+    "Tm": "std_structs",
+    "Struct": "structure",
+    "StructPointer": "structure",
+    "StructArray": "structure",
+    "StructRecord": "structure",
+    "VarPointer": "var_pointer",
+    "to_var_ptr": "var_pointer",
+}
+# submodules re-exported as a whole, in order of precedence
+_LAZY_STAR = ("bindings", "api_bindings")
+
+_EAGER_ALL = (
+    "force_set_attr",
+    "Arena",
+    "BaseAllocatedPointer",
+    "BaseCPointer",
+    "BaseObjectPointer",
+    "BasePointer",
+    "BasicPointer",
+    "Dereferencable",
+    "IterDereferencable",
+    "Sized",
+    "TypedCPointer",
+    "VoidPointer",
+    "array",
+    "array_from",
+    "cast",
+    "to_c_ptr",
+    "to_func_ptr",
+    "to_struct_ptr",
+    "to_voidp",
+    "AllocatedArrayPointer",
+    "calloc",
+    "AllocationError",
+    "DereferenceError",
+    "FreedMemoryError",
+    "InvalidBindingParameter",
+    "InvalidSizeError",
+    "NullPointerError",
+    "SegmentViolation",
+    "VariableLifetimeError",
+    "AllocatedPointer",
+    "free",
+    "malloc",
+    "realloc",
+    "array_from_ndarray",
+    "Pointer",
+    "PointerArray",
+    "deref_many",
+    "to_ptr",
+    "to_ptrs",
+    "Pool",
+    "pool_malloc",
+    "StackAllocatedPointer",
+    "acquire_stack_alloc",
+    "stack_alloc",
+    "NULL",
+    "Nullable",
+    "handle",
+    "raw_type",
+    "stop_handler",
+    "struct_cast",
+    "unchecked",
+)
+
+
+def _import(module: str):
+    return _import_module(f".{module}", __name__)
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        names = {
+            name: None
+            for module in reversed(_LAZY_STAR)
+            for name in _import(module).__all__
+            if not name.startswith("_")
+        }
+        names.update(dict.fromkeys(_LAZY_NAMES))
+        names.update(dict.fromkeys(_EAGER_ALL))
+        value = tuple(names)
+    elif name in _LAZY_NAMES:
+        module = _import(_LAZY_NAMES[name])
+
+        # importing the submodule may have bound its own name here
+        for attr, source in _LAZY_NAMES.items():
+            if source == _LAZY_NAMES[name]:
+                globals()[attr] = getattr(module, attr)
+
+        return globals()[name]
+    else:
+        for module in _LAZY_STAR:
+            mod = _import(module)
+
+            if name in mod.__all__:
+                value = getattr(mod, name)
+                break
+        else:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}",
+            )
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__getattr__("__all__")})
+
 
 __version__ = "3.0.0"
 __license__ = "MIT"
@@ -1,6 +1,6 @@
 import ctypes
 from ctypes import pythonapi as dll
-from typing import Dict, Optional, Tuple, Type
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Type
 
 __all__ = (
     "API_FUNCS",
@@ -9,7 +9,39 @@ __all__ = (
 
 CData = Type["ctypes._CData"]
 Func = Tuple[Optional["ctypes._NamedFuncPointer"], Optional[str], str]
-API_FUNCS: Dict[str, Func] = {}
+Signature = Tuple[Optional[CData], Optional[Tuple[CData, ...]], Optional[str]]
+
+
+class _APIFuncs(Mapping[str, Func]):
+    """C API functions, looked up in the interpreter on first access."""
+
+    def __init__(self) -> None:
+        self._signatures: Dict[str, Signature] = {}
+        self._resolved: Dict[str, Func] = {}
+
+    def __getitem__(self, name: str) -> Func:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            restype, argtypes, minver = self._signatures[name]
+
+        func: Optional["ctypes._NamedFuncPointer"] = getattr(dll, name, None)
+
+        if func:
+            func.argtypes = argtypes  # type: ignore
+            func.restype = restype
+
+        res = self._resolved[name] = (func, minver, name)
+        return res
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._signatures)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+API_FUNCS = _APIFuncs()
 
 
 def _register(
@@ -19,13 +51,8 @@ def _register(
     *,
     minver: Optional[str] = None,
 ) -> None:
-    func: Optional["ctypes._NamedFuncPointer"] = getattr(dll, name, None)
-
-    if func:
-        func.argtypes = argtypes  # type: ignore
-        func.restype = restype
-
-    API_FUNCS[name] = (func, minver, name)
+    API_FUNCS._signatures[name] = (restype, argtypes, minver)
+    API_FUNCS._resolved.pop(name, None)
 
 
 class PyTypeObject(ctypes.Structure):
@@ -1,7 +1,7 @@
 import ctypes
 from collections.abc import Callable
 from types import FunctionType, MethodType
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Tuple, Type, Union
 
 from _pointers import force_set_attr as _force_set_attr
 
@@ -10,6 +10,7 @@ from .exceptions import InvalidSizeError
 __all__ = (
     "attempt_decode",
     "move_to_mem",
+    "move_to_addr",
     "map_type",
     "get_mapped",
     "is_mappable",
@@ -71,6 +72,24 @@ def move_to_mem(
     ctypes.memmove(ptr, stream, slen)
 
 
+def move_to_addr(
+    address: int,
+    size: int,
+    source: int,
+    length: int,
+    *,
+    unsafe: bool = False,
+    target: str = "memory allocation",
+) -> None:
+    """Copy memory from one address to another, without an intermediate copy."""  # noqa
+    if (length > size) and (not unsafe):
+        raise InvalidSizeError(
+            f"object is of size {length}, while {target} is {size}",
+        )
+
+    ctypes.memmove(address, source, length)
+
+
 def attempt_decode(data: bytes) -> Union[str, bytes]:
     """Attempt to decode a string of bytes."""
     try:
@@ -88,16 +107,68 @@ def map_type(data: Any) -> "ctypes._CData":
     except TypeError:
         return ctypes.py_object(data)
 
-def get_mapped(typ: Any) -> "Type[ctypes._CData]":
-    """Get the C mapped value of the given type."""
+
+# types that have been mapped before, filled by get_mapped
+_MAPPED: Dict[Any, Type["ctypes._CData"]] = {}
+# function types by (return type, *argument types)
+_SIGNATURES: Dict[Tuple[Any, ...], Type["ctypes._CData"]] = {}
+
+
+def _mapped_table() -> Dict[Any, Type["ctypes._CData"]]:
+    # VoidPointer can't be imported at the top because of circular imports
     from .c_pointer import VoidPointer
 
+    _MAPPED.update(_C_TYPES)
+    _MAPPED[VoidPointer] = ctypes.c_void_p
+    return _MAPPED
+
+
+def _signature_type(res: Any, args: Tuple[Any, ...]) -> "Type[ctypes._CData]":
+    key = (res, *args)
+
+    try:
+        return _SIGNATURES[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable annotations
+        key = ()
+
+    func_type = ctypes.CFUNCTYPE(
+        get_mapped(res) if res else None,
+        *map(get_mapped, args),
+    )
+
+    if key:
+        _SIGNATURES[key] = func_type
+
+    return func_type
+
+
+def get_mapped(typ: Any) -> "Type[ctypes._CData]":
+    """Get the C mapped value of the given type.
+
+    ctypes simple types (e.g. `ctypes.c_int`) are returned as they are.
+    Any other unknown type maps to `ctypes.py_object`.
+    """
+    table = _MAPPED or _mapped_table()
+
+    try:
+        mapped = table.get(typ)
+    except TypeError:  # unhashable
+        mapped = None
+
+    if mapped:
+        return mapped
+
     if getattr(typ, "__origin__", None) is Callable:
         args = list(typ.__args__)
         res = args.pop(-1)
-        return ctypes.CFUNCTYPE(get_mapped(res), *map(get_mapped, args))
+        # generic aliases compare by their arguments, so they can be cached
+        mapped = table[typ] = _signature_type(res, tuple(args))
+        return mapped
 
     if type(typ) in {FunctionType, MethodType}:
+        # annotations can change, so only the signature is cached
         hints = typ.__annotations__.copy()
         try:
             res = hints.pop("return")
@@ -106,16 +177,16 @@ def get_mapped(typ: Any) -> "Type[ctypes._CData]":
                 "return type annotation is required to convert to a C function"  # noqa
             ) from e
 
-        args = hints.values()
-        return ctypes.CFUNCTYPE(
-            get_mapped(res) if res else None,
-            *map(get_mapped, args),
-        )
+        return _signature_type(res, tuple(hints.values()))
 
-    # VoidPointer needs to be passed here to stop circular imports
-    return {**_C_TYPES, VoidPointer: ctypes.c_void_p}.get(  # type: ignore
+    if isinstance(typ, type) and issubclass(
         typ,
-    ) or ctypes.py_object
+        ctypes._SimpleCData,  # type: ignore
+    ):
+        table[typ] = typ
+        return typ
+
+    return ctypes.py_object
 
 
 def is_mappable(typ: Any) -> bool:
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+from ._cstd import c_free, c_malloc
+from .exceptions import AllocationError, FreedMemoryError
+from .malloc import AllocatedPointer, _AllocationRecord
+
+__all__ = ("Arena",)
+
+
+class _ArenaScope:
+    """Sub-allocations made by an arena between two resets."""
+
+    __slots__ = ("arena", "freed", "_exports")
+
+    def __init__(self, arena: Arena) -> None:
+        self.arena = arena
+        self.freed = False
+        self._exports = 0
+
+    def release(self, record: _AllocationRecord) -> None:
+        self.arena._release(record)
+
+
+class Arena:
+    """Bump allocator handing out pieces of larger `malloc` regions.
+
+    Example:
+        ```py
+        with Arena() as arena:
+            ptr = arena.allocate(28)
+            ptr <<= 1
+        ```
+    """
+
+    def __init__(self, region_size: int = 65536, alignment: int = 16) -> None:
+        """
+        Args:
+            region_size: Size of each region requested from `malloc`.
+            alignment: Alignment of every sub-allocation, must be a power of two.
+        """  # noqa
+        if region_size <= 0:
+            raise ValueError("region size must be positive")
+
+        if (alignment <= 0) or (alignment & (alignment - 1)):
+            raise ValueError("alignment must be a power of two")
+
+        self._region_size = region_size
+        self._alignment = alignment
+        self._regions: List[Tuple[int, int]] = []
+        self._region = -1
+        self._offset = 0
+        self._capacity = 0
+        self._used = 0
+        self._high_water = 0
+        self._scope = _ArenaScope(self)
+        self._closed = False
+
+    @property
+    def used(self) -> int:
+        """Bytes handed out since the last reset, including alignment padding."""  # noqa
+        return self._used
+
+    @property
+    def high_water(self) -> int:
+        """Highest value `used` has reached."""
+        return self._high_water
+
+    @property
+    def capacity(self) -> int:
+        """Total size of the regions owned by the arena."""
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        """Whether the regions of the arena have been freed."""
+        return self._closed
+
+    def __repr__(self) -> str:
+        return f"Arena(used={self.used}, capacity={self.capacity})"
+
+    def _aligned(self, address: int, offset: int) -> int:
+        # the absolute address is aligned, since malloc only guarantees
+        # alignment up to max_align_t
+        mask = self._alignment - 1
+        return ((address + offset + mask) & ~mask) - address
+
+    def _next_region(self, size: int) -> None:
+        # regions kept from before a reset are reused when they are big enough
+        while self._region + 1 < len(self._regions):
+            self._region += 1
+            self._offset = 0
+            address, region_size = self._regions[self._region]
+
+            if self._aligned(address, 0) + size <= region_size:
+                return
+
+        region_size = max(self._region_size, size)
+        address = c_malloc(region_size)
+
+        if address and (self._aligned(address, 0) + size > region_size):
+            c_free(address)
+            region_size += self._alignment - 1
+            address = c_malloc(region_size)
+
+        if not address:
+            raise AllocationError("failed to allocate memory")
+
+        self._regions.append((address, region_size))
+        self._capacity += region_size
+        self._region = len(self._regions) - 1
+        self._offset = 0
+
+    def allocate(self, size: int) -> AllocatedPointer[Any]:
+        """Allocate memory of a given size from the arena.
+
+        Args:
+            size: Allocation size.
+
+        Returns:
+            Pointer to the allocated memory. Calling `free` on it only gives
+            the memory back if it was the latest allocation.
+
+        Raises:
+            FreedMemoryError: The arena has been closed.
+            AllocationError: Raised when a new region could not be allocated.
+        """
+        if self._closed:
+            raise FreedMemoryError("arena has been closed")
+
+        if size < 0:
+            raise ValueError("allocation size must not be negative")
+
+        if self._region >= 0:
+            address, region_size = self._regions[self._region]
+            start = self._aligned(address, self._offset)
+
+        if (self._region < 0) or (start + size > region_size):
+            self._next_region(size)
+            address, region_size = self._regions[self._region]
+            start = self._aligned(address, 0)
+
+        self._used += start + size - self._offset
+        self._offset = start + size
+
+        if self._used > self._high_water:
+            self._high_water = self._used
+
+        return AllocatedPointer(
+            address + start,
+            size,
+            owner=self._scope,
+        )
+
+    def _release(self, record: _AllocationRecord) -> None:
+        if self._region < 0:
+            return
+
+        region_address = self._regions[self._region][0]
+        start = record.address - region_address
+
+        if (start >= 0) and (start + record.size == self._offset):
+            self._used -= self._offset - start
+            self._offset = start
+
+    def reset(self) -> None:
+        """Free every sub-allocation at once, keeping the regions for reuse.
+
+        Raises:
+            BufferError: A buffer of a sub-allocation is still exported.
+        """
+        if self._scope._exports:
+            raise BufferError(
+                "cannot reset an arena while a buffer of it is exported",
+            )
+
+        self._scope.freed = True
+        self._scope = _ArenaScope(self)
+        self._region = -1
+        self._offset = 0
+        self._used = 0
+
+    def close(self) -> None:
+        """Free every sub-allocation and give the regions back to libc.
+
+        Raises:
+            BufferError: A buffer of a sub-allocation is still exported.
+        """
+        self.reset()
+
+        for address, _ in self._regions:
+            c_free(address)
+
+        self._regions.clear()
+        self._capacity = 0
+        self._closed = True
+
+    def __enter__(self) -> Arena:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # __init__ may have failed before the regions existed
+        if getattr(self, "_regions", None):
+            self.close()
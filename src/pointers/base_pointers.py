@@ -3,17 +3,19 @@ import gc
 import sys
 import weakref
 from abc import ABC, abstractmethod
-from contextlib import suppress
-from typing import (Any, Generic, Iterator, Optional, Tuple, Type, TypeVar,
-                    Union)
+from typing import (TYPE_CHECKING, Any, Generic, Iterator, Optional, Tuple,
+                    Type, TypeVar, Union)
 
-from _pointers import add_ref, remove_ref
+from _pointers import add_ref, buffer_exporter, pointer_base, remove_ref
 from typing_extensions import final
 
-from ._utils import deref, force_set_attr, move_to_mem
+from ._utils import deref, force_set_attr, move_to_addr
 from .exceptions import DereferenceError, FreedMemoryError, NullPointerError
 from .util import NULL, Nullable, handle
 
+if TYPE_CHECKING:
+    import numpy as np
+
 __all__ = (
     "BasePointer",
     "BaseObjectPointer",
@@ -31,6 +33,8 @@ A = TypeVar("A", bound="BasicPointer")
 class BasicPointer(ABC):
     """Base class representing a pointer with no operations."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def address(self) -> Optional[int]:
@@ -80,6 +84,8 @@ class BasicPointer(ABC):
 
 
 class Movable(ABC, Generic[T, A]):
+    __slots__ = ()
+
     @abstractmethod
     def move(
         self,
@@ -102,6 +108,8 @@ class Movable(ABC, Generic[T, A]):
 class Dereferencable(ABC, Generic[T]):
     """Abstract class for an object that may be dereferenced."""
 
+    __slots__ = ()
+
     @abstractmethod
     def dereference(self) -> T:
         """Dereference the pointer.
@@ -120,6 +128,8 @@ class IterDereferencable(Dereferencable[T], Generic[T]):
     Abstract class for an object that may be dereferenced via * (`__iter__`)
     """
 
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[T]:
         return iter({self.dereference()})
 
@@ -133,6 +143,8 @@ class BasePointer(
 ):
     """Base class representing a pointer."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self) -> str:
         ...
@@ -164,39 +176,21 @@ class Sized(BasicPointer, ABC):
             ctypes.POINTER(ctypes.c_char * self.size),
         )
 
-    @abstractmethod
-    def _make_stream_and_ptr(
-        self,
-        size: int,
-        address: int,
-    ) -> Tuple["ctypes._PointerLike", bytes]:
-        ...
-
 
 class BaseObjectPointer(
+    pointer_base,
     IterDereferencable[T],
     BasePointer[T],
     ABC,
 ):
-    """Abstract class for a pointer to a Python object."""
+    """Abstract class for a pointer to a Python object.
 
-    def __init__(
-        self,
-        address: Optional[int],
-        increment_ref: bool = False,
-    ) -> None:
-        """
-        Args:
-            address: Address of the underlying value.
-            increment_ref: Should the reference count on the target object get incremented.
-        """  # noqa
-        self._address: Optional[int] = address
+    The reference to the target, `address`, `dereference` and `_cleanup` are
+    implemented by `_pointers.pointer_base`. Instances are created with the
+    address of the target, and `increment_ref` to take a new reference to it
+    instead of the one the caller already owns."""
 
-        if increment_ref and address:
-            add_ref(~self)
-
-        self._origin_size = sys.getsizeof(~self if address else None)
-        weakref.finalize(self, self._cleanup)
+    __slots__ = ("__weakref__",)
 
     @handle
     def set_attr(self, key: str, value: Any) -> None:
@@ -218,29 +212,18 @@ class BaseObjectPointer(
             target: New pointer or value to look at.
         """
         if target is NULL:
-            self._address = None
+            self._cleanup()
             return
 
-        new: BasePointer[T] = self._get_ptr(target)  # type: ignore
-
-        if not isinstance(new, BaseObjectPointer):
-            raise ValueError(
-                "can only point to object pointer",
-            )
+        if isinstance(target, BasePointer):
+            if not isinstance(target, BaseObjectPointer):
+                raise ValueError(
+                    "can only point to object pointer",
+                )
 
-        with suppress(NullPointerError):
-            remove_ref(~self)
-
-        self._address = new.address
-        add_ref(~self)
-
-    @property
-    def address(self) -> Optional[int]:
-        return self._address
+            target = ~target
 
-    @handle
-    def dereference(self) -> T:
-        return deref(self.ensure())
+        self._point_to(target)
 
     def __irshift__(
         self,
@@ -277,10 +260,6 @@ class BaseObjectPointer(
             else cls.make_from(obj)
         )
 
-    def _cleanup(self) -> None:
-        if self.address:
-            remove_ref(~self)
-
 
 class BaseCPointer(
     Movable[T, "BaseCPointer[T]"],
@@ -288,23 +267,21 @@ class BaseCPointer(
     Sized,
     ABC,
 ):
+    # the finalizer holds on to the pointer through the bound _cleanup, so
+    # pointers with nothing to clean up don't register one
+    _needs_cleanup: bool = True
+
     def __init__(self, address: int, size: int):
         self._address = address
         self._size = size
-        weakref.finalize(self, self._cleanup)
+
+        if self._needs_cleanup:
+            weakref.finalize(self, self._cleanup)
 
     @property
     def address(self) -> Optional[int]:
         return self._address
 
-    def _make_stream_and_ptr(
-        self,
-        size: int,
-        address: int,
-    ) -> Tuple["ctypes._PointerLike", bytes]:
-        bytes_a = (ctypes.c_ubyte * size).from_address(address)
-        return self.make_ct_pointer(), bytes(bytes_a)
-
     @handle
     def move(
         self,
@@ -318,11 +295,14 @@ class BaseCPointer(
                 f'"{type(data).__name__}" object is not a valid C pointer',
             )
 
-        ptr, byte_stream = self._make_stream_and_ptr(
-            data.size,
+        move_to_addr(
+            self.ensure(),
+            self.size,
             data.ensure(),
+            data.size,
+            unsafe=unsafe,
+            target="C data",
         )
-        move_to_mem(ptr, byte_stream, unsafe=unsafe, target="C data")
 
     def __ilshift__(self, data: Union["BaseCPointer[T]", T]):
         self.move(data)
@@ -350,7 +330,7 @@ class BaseCPointer(
         ...
 
 
-class BaseAllocatedPointer(BasePointer[T], Sized, ABC):
+class BaseAllocatedPointer(buffer_exporter, BasePointer[T], Sized, ABC):
     @property
     @abstractmethod
     def address(self) -> Optional[int]:
@@ -395,12 +375,13 @@ class BaseAllocatedPointer(BasePointer[T], Sized, ABC):
             raise RuntimeError("allocation on tracked types is not supported on 3.11+")
 
 
-        ptr, byte_stream = self._make_stream_and_ptr(
-            sys.getsizeof(~data_ptr),
+        move_to_addr(
+            self.ensure(),
+            self.size,
             data_ptr.ensure(),
+            sys.getsizeof(~data_ptr),
+            unsafe=unsafe,
         )
-
-        move_to_mem(ptr, byte_stream, unsafe=unsafe)
         self.assigned = True
         remove_ref(data)
 
@@ -429,22 +410,39 @@ class BaseAllocatedPointer(BasePointer[T], Sized, ABC):
     def _cleanup(self) -> None:
         pass
 
-    def _make_stream_and_ptr(
-        self,
-        size: int,
-        address: int,
-    ) -> Tuple["ctypes._PointerLike", bytes]:
-        if self.freed:
-            raise FreedMemoryError("memory has been freed")
-        
-        bytes_a = (ctypes.c_ubyte * size).from_address(address)  # fmt: off
-        return self.make_ct_pointer(), bytes(bytes_a)
-
     @abstractmethod
     def free(self) -> None:
         """Free the memory."""
         ...
 
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        # called by buffer_exporter whenever a buffer is requested
+        self.ensure_valid()
+        return self.ensure(), self.size, 1, "B", False
+
+    def _release_buffer(self) -> None:
+        pass
+
+    @property
+    def _exports(self) -> int:
+        # number of buffers of the memory that are still alive
+        return 0
+
+    def as_ndarray(self, dtype: Any = None) -> "np.ndarray[Any, Any]":
+        """Get an ndarray sharing memory with the allocation, without copying.
+
+        The memory cannot be freed while the ndarray is alive. Requires NumPy to be installed.
+
+        Args:
+            dtype: Element type, either a Python type, a `ctypes` type, or anything NumPy accepts as a dtype. Raw bytes by default.
+
+        Raises:
+            TypeError: The element type has no numeric equivalent.
+        """  # noqa
+        from .ndarray import _as_ndarray
+
+        return _as_ndarray(self, ctypes.c_ubyte if dtype is None else dtype)
+
     def ensure_valid(self) -> None:
         """Ensure the memory has not been freed."""
         if self.freed:
@@ -1,6 +1,7 @@
 import ctypes
 import inspect
 import warnings
+from collections import OrderedDict
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -9,6 +10,8 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
+    Mapping,
     Optional,
     Sequence,
     Type,
@@ -16,7 +19,6 @@ from typing import (
     Union,
 )
 
-from _pointers import add_ref
 
 from ._cstd import c_calloc as _calloc
 from ._cstd import c_free as _free
@@ -24,10 +26,11 @@ from ._cstd import c_malloc as _malloc
 from ._cstd import c_raise as ct_raise
 from ._cstd import c_realloc as _realloc
 from ._cstd import dll, mdll
-from ._utils import get_mapped, get_py
+from ._utils import _PY_TYPES, get_mapped, get_py
 from .base_pointers import BaseCPointer, BasePointer
 from .c_pointer import TypedCPointer, VoidPointer
 from .exceptions import InvalidBindingParameter
+from .object_pointer import PointerArray
 from .std_structs import STRUCT_MAP, DivT, Lconv, LDivT, Tm
 from .structure import StructPointer
 from .util import NULL, Nullable, handle
@@ -38,6 +41,7 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 PointerLike = Nullable[Optional[Union[TypedCPointer[T], VoidPointer]]]
+_PY_OBJECT_P = ctypes.POINTER(ctypes.py_object)
 StringLike = Optional[Union[str, bytes, VoidPointer, TypedCPointer[bytes]]]
 Format = Union[StringLike, PointerLike]
 TypedPtr = Optional[PointerLike[T]]
@@ -169,7 +173,7 @@ def _not_null(data: Optional[T]) -> T:
     return data
 
 
-StructMap = Dict[Type[ctypes.Structure], Type["Struct"]]
+StructMap = Mapping[Type[ctypes.Structure], Type["Struct"]]
 CharLike = Union[StringLike, int]
 
 
@@ -179,7 +183,6 @@ class _CFuncTransport:
         c_func: "ctypes._FuncPointer",
         py_func: Callable,
     ) -> None:
-        add_ref(c_func)
         self._c_func = c_func
         self._py_func = py_func
 
@@ -231,12 +234,116 @@ def _decode_type(
     return res
 
 
-def _decode_response(
-    res: Any,
+def _decode_bytes(res: Any) -> Any:
+    return res.decode() if isinstance(res, bytes) else res
+
+
+def _decode_void_p(res: Any) -> VoidPointer:
+    return VoidPointer(res, ctypes.sizeof(ctypes.c_void_p))
+
+
+# return types that _decode_type would hand back untouched
+_RAW_RESTYPES = {
+    ct
+    for ct, py in _PY_TYPES.items()
+    if (py in {int, float, bool, str}) and (ct is not ctypes.c_void_p)
+}
+
+
+def _make_decoder(
+    restype: Any,
     struct_map: StructMap,
-    fn: "ctypes._NamedFuncPointer",
-) -> Any:
-    return _decode_type(res, struct_map, fn.restype)  # type: ignore
+) -> Optional[Callable[[Any], Any]]:
+    if (restype is None) or (restype in _RAW_RESTYPES):
+        return None
+
+    if restype is ctypes.c_void_p:
+        return _decode_void_p
+
+    if restype is ctypes.c_char_p:
+        return _decode_bytes
+
+    return lambda res: _decode_type(res, struct_map, restype)
+
+
+def _param_type(
+    typ: Type["ctypes._CData"],
+    struct_map: StructMap,
+) -> Optional[type]:
+    if isinstance(typ, PyCFuncPtrType):
+        # anything is accepted for a function pointer
+        return None
+
+    n_type = get_py(typ)
+
+    if typ.__name__.startswith("LP_"):
+        ptr_tp = typ._type_  # type: ignore
+        if issubclass(ptr_tp, ctypes.Structure):  # type: ignore
+            n_type = StructPointer
+            struct = struct_map.get(ptr_tp)
+
+            if not struct:
+                warnings.warn(
+                    f"struct {ptr_tp.__name__} not in struct map",
+                    UserWarning,
+                )
+
+    return None if n_type is Any else n_type
+
+
+def _check_arg(
+    value: Any,
+    typ: Type["ctypes._CData"],
+    n_type: type,
+    index: int,
+    name: str,
+) -> None:
+    is_type: bool = isinstance(value, type)
+
+    if (isinstance if not is_type else issubclass)(value, n_type):
+        return
+
+    v_type = type(value) if not is_type else value
+
+    if (n_type in {BasePointer, BaseCPointer, StructPointer}) and (
+        value is None
+    ):
+        return
+
+    if (
+        typ
+        in {
+            ctypes.c_char_p,
+            ctypes.c_void_p,
+        }
+    ) and (value is None):
+        return
+
+    if ((v_type is ctypes.c_char_p) and (n_type is bytes)) or (
+        issubclass(v_type, BaseCPointer) and (typ is ctypes.c_void_p)
+    ):
+        return
+
+    if issubclass(v_type, PointerArray) and (typ is _PY_OBJECT_P):
+        return
+
+    raise InvalidBindingParameter(
+        f"argument {index + 1} of {name} got invalid type: expected {n_type.__name__}, got {v_type.__name__}"  # noqa
+    )
+
+
+def _validate_transport(
+    transport: _CFuncTransport,
+    struct_map: StructMap,
+) -> None:
+    py_func = transport.py_func
+    sig = inspect.signature(py_func)
+    _process_args(
+        [param.annotation for param in sig.parameters.values()],
+        transport.c_func._argtypes_,  # type: ignore
+        py_func.__name__,
+        struct_map,
+    )
 
 
 def _process_args(
@@ -250,80 +357,48 @@ def _process_args(
             continue
 
         if isinstance(value, _CFuncTransport):
-            py_func = value.py_func
-            sig = inspect.signature(py_func)
-            _process_args(
-                [param.annotation for param in sig.parameters.values()],
-                value.c_func._argtypes_,  # type: ignore
-                py_func.__name__,
-                struct_map,
-            )
+            _validate_transport(value, struct_map)
             continue
-        is_c_func: bool = isinstance(
-            typ,
-            PyCFuncPtrType,
-        )
-        n_type = get_py(typ) if not is_c_func else FunctionType
 
-        if typ.__name__.startswith("LP_"):
-            ptr_tp = typ._type_  # type: ignore
-            if issubclass(ptr_tp, ctypes.Structure):  # type: ignore
-                n_type = StructPointer
-                struct = struct_map.get(ptr_tp)
+        n_type = _param_type(typ, struct_map)
 
-                if not struct:
-                    warnings.warn(
-                        f"struct {ptr_tp.__name__} not in struct map",
-                        UserWarning,
-                    )
+        if n_type is not None:
+            _check_arg(value, typ, n_type, index, name)
 
-        is_type: bool = isinstance(value, type)
 
-        if n_type is Any:
-            continue
+# maximum number of callback trampolines kept alive by _solve_func
+_MAX_TRAMPOLINES: int = 256
+_TRAMPOLINES: "OrderedDict[Any, _CFuncTransport]" = OrderedDict()
+# callbacks passed with keep_alive, which C may call at any point later on
+_PINNED: Dict[int, "ctypes._FuncPointer"] = {}
 
-        if not (isinstance if not is_type else issubclass)(value, n_type):
-            v_type = type(value) if not is_type else value
 
-            if (n_type in {BasePointer, BaseCPointer, StructPointer}) and (
-                value is None
-            ):
-                continue
+def _solve_func(
+    fn: Callable,
+    ct_fn: "ctypes._FuncPointer",
+    struct_map: StructMap,
+) -> _CFuncTransport:
+    # the transport references struct_map, so its id stays unique
+    key = (fn, ct_fn, id(struct_map))
+    transport = _TRAMPOLINES.get(key)
 
-            if (n_type is FunctionType) and is_c_func:
-                continue
+    if transport is not None:
+        _TRAMPOLINES.move_to_end(key)
+        return transport
 
-            if (
-                typ
-                in {
-                    ctypes.c_char_p,
-                    ctypes.c_void_p,
-                }
-            ) and (value is None):
-                continue
+    transport = _make_trampoline(fn, ct_fn, struct_map)
+    _validate_transport(transport, struct_map)
+    _TRAMPOLINES[key] = transport
 
-            if ((v_type is ctypes.c_char_p) and (n_type is bytes)) or (
-                issubclass(v_type, BaseCPointer) and (typ is ctypes.c_void_p)
-            ):
-                continue
+    while len(_TRAMPOLINES) > _MAX_TRAMPOLINES:
+        # nothing else references an evicted trampoline, so ctypes
+        # releases it once any call currently using it returns
+        _TRAMPOLINES.popitem(last=False)
 
-            raise InvalidBindingParameter(
-                f"argument {index + 1} of {name} got invalid type: expected {n_type.__name__}, got {v_type.__name__}"  # noqa
-            )
+    return transport
 
 
-def _validate_args(
-    args: Iterable[Any],
-    fn: "ctypes._NamedFuncPointer",
-    struct_map: StructMap,
-) -> None:
-    if not fn.argtypes:
-        return
-
-    _process_args(args, fn.argtypes, fn.__name__, struct_map)
-
-
-def _solve_func(
+def _make_trampoline(
     fn: Callable,
     ct_fn: "ctypes._FuncPointer",
     struct_map: StructMap,
@@ -342,56 +417,130 @@ def _solve_func(
     return _CFuncTransport(wrapper, fn)
 
 
-@handle
-def binding_base(
-    fn: "ctypes._NamedFuncPointer",
-    *simple_args,
-    map_extra: Optional[StructMap] = None,
-) -> Any:
-    smap = {**STRUCT_MAP, **(map_extra or {})}
+def _make_converter(
+    typ: Type["ctypes._CData"],
+    index: int,
+    name: str,
+    struct_map: StructMap,
+) -> Callable[[Any], Any]:
+    n_type = _param_type(typ, struct_map)
+    is_c_func: bool = isinstance(typ, PyCFuncPtrType)
+    # argument types that already passed validation as-is
+    accepted = {n_type}
 
-    args = [i if i is not NULL else None for i in simple_args]
+    def convert(value: Any) -> Any:
+        if value is NULL:
+            value = None
 
-    validator_args = [
-        arg
-        if (
-            (not isinstance(arg, FunctionType))
-            and (not isinstance(arg, PyCFuncPtrType))
-        )
-        else _solve_func(
-            arg,  # type: ignore
-            typ,  # type: ignore
-            smap,
+        v_type = type(value)
+
+        if v_type in accepted:
+            return value
+
+        if is_c_func and isinstance(value, (FunctionType, PyCFuncPtrType)):
+            return _solve_func(value, typ, struct_map).c_func  # type: ignore
+
+        if isinstance(value, _CFuncTransport):
+            _validate_transport(value, struct_map)
+            return value.c_func
+
+        if n_type is not None:
+            _check_arg(value, typ, n_type, index, name)
+
+        if not isinstance(value, type):
+            accepted.add(v_type)
+
+        return value
+
+    return convert
+
+
+class _CallPlan:
+    """Argument converters and result decoder compiled for a C function."""
+
+    def __init__(
+        self,
+        fn: "ctypes._NamedFuncPointer",
+        struct_map: StructMap,
+    ) -> None:
+        # keeps the function alive, so its id can't be reused as a key
+        self.fn = fn
+        self.argtypes = fn.argtypes
+        self.restype = fn.restype
+        self.converters: Optional[List[Callable[[Any], Any]]] = (
+            [
+                _make_converter(typ, index, fn.__name__, struct_map)
+                for index, typ in enumerate(fn.argtypes)
+            ]
+            if fn.argtypes
+            else None
         )
-        for arg, typ in zip(
-            args,
-            fn.argtypes or [None for _ in args],  # type: ignore
+        self.decode = _make_decoder(fn.restype, struct_map)
+
+    def is_current(self, fn: "ctypes._NamedFuncPointer") -> bool:
+        """Whether the signature of the function is still the one compiled."""
+        return (self.argtypes is fn.argtypes) and (
+            self.restype is fn.restype
         )
-    ]
 
-    _validate_args(
-        validator_args,
-        fn,
-        smap,
-    )
+    def convert(self, args: Sequence[Any]) -> List[Any]:
+        """Validate and convert arguments for the C function."""
+        if self.converters is None:
+            return [i if i is not NULL else None for i in args]
 
-    res = fn(
-        *[
-            i
-            if not isinstance(
-                i,
-                _CFuncTransport,
-            )
-            else i.c_func
-            for i in validator_args
+        return [
+            convert(value) for convert, value in zip(self.converters, args)
         ]
-    )
 
-    return _decode_response(
-        res,
-        smap,
+
+# maximum number of call plans cached by _get_plan
+_MAX_PLANS: int = 1024
+_PLANS: "OrderedDict[Any, _CallPlan]" = OrderedDict()
+
+
+def _get_plan(
+    fn: "ctypes._NamedFuncPointer",
+    map_extra: Optional[StructMap],
+) -> _CallPlan:
+    # function pointers aren't hashable
+    key = id(fn) if not map_extra else (id(fn), *map_extra.items())
+    plan = _PLANS.get(key)
+
+    if (plan is not None) and plan.is_current(fn):
+        _PLANS.move_to_end(key)
+        return plan
+
+    plan = _CallPlan(
         fn,
+        STRUCT_MAP if not map_extra else {**STRUCT_MAP, **map_extra},
     )
+    _PLANS[key] = plan
+
+    while len(_PLANS) > _MAX_PLANS:
+        # function pointers made per call would otherwise pile up here
+        _PLANS.popitem(last=False)
+
+    return plan
+
+
+@handle
+def binding_base(
+    fn: "ctypes._NamedFuncPointer",
+    *simple_args,
+    map_extra: Optional[StructMap] = None,
+    keep_alive: bool = False,
+) -> Any:
+    plan = _get_plan(fn, map_extra)
+    args = plan.convert(simple_args)
+
+    if keep_alive:
+        for value in args:
+            if isinstance(value, ctypes._CFuncPtr):  # type: ignore
+                _PINNED[id(value)] = value
+
+    res = fn(*args)
+    return res if plan.decode is None else plan.decode(res)
+
 
 @handle
 def make_string(data: StringLike) -> Union[bytes, ctypes.c_char_p]:
@@ -1067,8 +1216,23 @@ def gmtime(timer: PointerLike) -> StructPointer[Tm]:
     return binding_base(dll.gmtime, timer)
 
 
+# installed handlers must outlive the trampoline cache
+_SIGNAL_HANDLERS: Dict[int, Callable[[int], Any]] = {}
+
+
 def signal(signum: int, func: Callable[[int], Any]) -> None:
-    return binding_base(dll.signal, signum, func)
+    res = binding_base(dll.signal, signum, func)
+
+    if isinstance(func, FunctionType):
+        _SIGNAL_HANDLERS[signum] = _solve_func(
+            func,
+            dll.signal.argtypes[1],
+            STRUCT_MAP,
+        ).c_func
+    else:
+        _SIGNAL_HANDLERS.pop(signum, None)
+
+    return res
 
 
 def qsort(
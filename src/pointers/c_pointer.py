@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import ctypes
+import sys
 from abc import ABC, abstractmethod
-from typing import (TYPE_CHECKING, Any, Callable, Iterator, List, Optional,
-                    Type, TypeVar)
+from itertools import islice
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Tuple, Type, TypeVar, Union, overload)
 
-from _pointers import add_ref, remove_ref
+from _pointers import add_ref, buffer_exporter, remove_ref
 from typing_extensions import ParamSpec
 
-from ._utils import deref, get_mapped, map_type
+from ._cstd import c_free, c_malloc, c_realloc
+from ._utils import _C_TYPES, deref, get_mapped, map_type
 from .base_pointers import BaseCPointer, IterDereferencable
+from .exceptions import AllocationError
 from .util import handle
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .structure import Struct, StructPointer
 
 T = TypeVar("T")
@@ -26,6 +32,7 @@ __all__ = (
     "cast",
     "to_voidp",
     "array",
+    "array_from",
     "to_struct_ptr",
     "to_func_ptr",
 )
@@ -34,6 +41,8 @@ __all__ = (
 class VoidPointer(BaseCPointer[Any]):
     """Class representing a void pointer to a C object."""
 
+    _needs_cleanup = False
+
     @property
     def size(self) -> int:
         return self._size
@@ -119,7 +128,29 @@ class FunctionPointer(BaseCPointer[Callable[P, T]]):  # type: ignore
         return f"FunctionPointer(address={self.address})"
 
 
-class TypedCPointer(_CDeref[T], BaseCPointer[T]):
+# struct module formats of ctypes types, for buffer exports
+_FORMATS: Dict[Type["ctypes._CData"], str] = {}
+# ctypes types that don't hold a plain number
+_NON_NUMERIC = (ctypes.py_object, ctypes.c_char_p, ctypes.c_wchar_p)
+# python types that an array element type maps back to
+_ELEMENT_TYPES: Dict[Type["ctypes._CData"], type] = {
+    ctype: typ for typ, ctype in _C_TYPES.items() if ctype not in _NON_NUMERIC
+}
+
+
+def _buffer_format(ctype: Type["ctypes._CData"]) -> str:
+    fmt = _FORMATS.get(ctype)
+
+    if fmt is None:
+        fmt = memoryview(ctype()).format
+        # ctypes spells out the native byte order, memoryview only
+        # supports native formats without it
+        fmt = _FORMATS[ctype] = fmt.lstrip("<>")
+
+    return fmt
+
+
+class TypedCPointer(buffer_exporter, _CDeref[T], BaseCPointer[T]):
     """Class representing a pointer with a known type."""
 
     def __init__(
@@ -180,14 +211,9 @@ class TypedCPointer(_CDeref[T], BaseCPointer[T]):
             res = ctypes.c_char_p(self.ensure()).value
             return res  # type: ignore
 
-        ptr = (
-            ctype.from_address(self.ensure())
-            if not self._void_p
-            else ctypes.cast(
-                ctypes.c_void_p(self.address), ctypes.POINTER(ctype)
-            )  # fmt: off
-        )
-        return ptr.value if not self._void_p else ptr.contents.value  # type: ignore # noqa
+        # casting to a pointer and reading its contents (for void pointers)
+        # ends up at the same address
+        return ctype.from_address(self.ensure()).value  # type: ignore
 
     def __iter__(self) -> Iterator[T]:
         """Dereference the pointer."""
@@ -196,46 +222,253 @@ class TypedCPointer(_CDeref[T], BaseCPointer[T]):
     def __repr__(self) -> str:
         return f"TypedCPointer(address={self.address}, size={self.size})"
 
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        ctype = get_mapped(self.type)
+        return self.ensure(), 1, ctypes.sizeof(ctype), _buffer_format(ctype), False  # noqa
+
+    def _release_buffer(self) -> None:
+        pass
+
+    def as_ndarray(self) -> "np.ndarray[Any, Any]":
+        """Get a single element ndarray sharing memory with the target.
+
+        Requires NumPy to be installed.
+
+        Raises:
+            TypeError: The pointer type has no numeric equivalent.
+        """
+        from .ndarray import _as_ndarray
 
-class CArrayPointer(_CDeref[List[T]], BaseCPointer[List[T]]):
+        return _as_ndarray(self, self.type)
+
+
+class CArrayPointer(
+    buffer_exporter,
+    _CDeref[List[T]],
+    BaseCPointer[List[T]],
+):
     """Class representing a pointer to a C array."""
 
+    _needs_cleanup = False
+
     def __init__(
         self,
         address: int,
         size: int,
         length: int,
         typ: Type[T],
+        *,
+        owner: Any = None,
     ):
+        """
+        Args:
+            address: Address of the first element.
+            size: Size of the whole array.
+            length: Number of elements.
+            typ: Type of every element.
+            owner: Object that owns the memory, kept alive by the pointer.
+        """
         self._length = length
         self._type = typ
+        self._ctype = get_mapped(typ)
         self._decref = False
+        self._owner = owner
+        # ctypes array over the elements, created on first access
+        self._elements: Optional["ctypes.Array[Any]"] = None
         super().__init__(address, size)
 
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def address(self) -> Optional[int]:
+        return self._address
+
     @property
     def decref(self) -> bool:
         return self._decref
 
+    @property
+    def length(self) -> int:
+        """Number of elements in the array."""
+        return self._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _get_elements(self) -> "ctypes.Array[Any]":
+        elements = self._elements
+
+        if elements is None:
+            elements = self._elements = (self._ctype * self._length).from_address(  # noqa
+                self.ensure(),
+            )
+
+        return elements
+
     @property
     @handle
     def _as_parameter_(self) -> "ctypes.Array[ctypes._CData]":
-        ctype = get_mapped(self._type)
-
-        deref = (ctype * self._length).from_address(self.ensure())
-        return deref
+        return self._get_elements()
 
     @handle
     def dereference(self) -> List[T]:
         """Dereference the pointer."""
-        array = self._as_parameter_
-        return [array[i] for i in range(self._length)]  # type: ignore
+        return self._get_elements()[:]
+
+    def _cleanup(self) -> None:
+        # the elements are never owned references
+        pass
 
     def __repr__(self) -> str:
         return f"CArrayPointer(address={self.address}, size={self.size})"
 
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        ctype = self._ctype
+        return (
+            self.ensure(),
+            self._length,
+            ctypes.sizeof(ctype),
+            _buffer_format(ctype),
+            False,
+        )
+
+    def _release_buffer(self) -> None:
+        pass
+
+    def as_ndarray(self) -> "np.ndarray[Any, Any]":
+        """Get an ndarray sharing memory with the array, without copying.
+
+        Requires NumPy to be installed.
+
+        Raises:
+            TypeError: The element type has no numeric equivalent.
+        """
+        from .ndarray import _as_ndarray
+
+        return _as_ndarray(self, self._type)
+
+    def _slice(self, index: slice) -> CArrayPointer[T]:
+        start, stop, step = index.indices(self._length)
+
+        if step != 1:
+            raise ValueError("array slices must be contiguous")
+
+        length = max(stop - start, 0)
+        itemsize = ctypes.sizeof(self._ctype)
+
+        return CArrayPointer(
+            self.ensure() + start * itemsize,
+            length * itemsize,
+            length,
+            self._type,
+            owner=self,
+        )
+
+    @overload
     def __getitem__(self, index: int) -> T:
-        array = ~self
-        return array[index]
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CArrayPointer[T]:
+        ...
+
+    @handle
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[T, CArrayPointer[T]]:
+        """Get a single element, or a view of a contiguous part of the array."""  # noqa
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        return self._get_elements()[index]
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None:
+        ...
+
+    @handle
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        self._get_elements()[index] = value
+
+    def tolist(self) -> List[T]:
+        """Copy the elements into a list."""
+        return self.dereference()
+
+    @handle
+    def fill(self, value: T) -> None:
+        """Set every element to the same value."""
+        elements = self._get_elements()
+        length = self._length
+
+        if not length:
+            return
+
+        if self._ctype in _NON_NUMERIC:
+            # copying the raw pointers would skip the reference counting,
+            # and the buffers that ctypes keeps alive for each element
+            elements[:] = [value] * length
+            return
+
+        elements[0] = value
+        itemsize = ctypes.sizeof(self._ctype)
+        address = self.ensure()
+        filled = 1
+
+        # double the filled part every time, so only log(n) copies are made
+        while filled < length:
+            count = min(filled, length - filled)
+            ctypes.memmove(
+                address + filled * itemsize,
+                address,
+                count * itemsize,
+            )
+            filled += count
+
+    @handle
+    def copy_from(self, source: Iterable[T]) -> None:
+        """Copy elements into the start of the array.
+
+        Objects supporting the buffer protocol are copied byte for byte, anything else is treated as a sequence of elements.
+
+        Raises:
+            ValueError: The source does not fit in the array.
+        """  # noqa
+        if self._ctype not in _NON_NUMERIC:
+            try:
+                view = memoryview(source)  # type: ignore
+            except TypeError:
+                pass
+            else:
+                with view:
+                    self._copy_buffer(view)
+                return
+
+        values = source if isinstance(source, list) else list(source)
+
+        if len(values) > self._length:
+            raise ValueError(
+                f"cannot copy {len(values)} elements into an array of {self._length}",  # noqa
+            )
+
+        self._get_elements()[: len(values)] = values
+
+    def _copy_buffer(self, view: memoryview) -> None:
+        if view.nbytes > self.size:
+            raise ValueError(
+                f"cannot copy {view.nbytes} bytes into an array of {self.size}",  # noqa
+            )
+
+        source = view.cast("B") if view.c_contiguous else view.tobytes()
+
+        with memoryview(self._get_elements()) as target:
+            target.cast("B")[: view.nbytes] = source
 
 
 @handle
@@ -286,18 +519,204 @@ def array(*seq: T) -> CArrayPointer[T]:
                 "all values in the array must be the same type",
             )
 
-    length = len(seq)
-    ctype = get_mapped(f_type)
-    arr = (ctype * length)(*seq)  # type: ignore
-    add_ref(arr)
+    return array_from(seq, f_type)
+
+
+class _CArrayMemory:
+    """Memory from `malloc` backing an array, freed along with it."""
+
+    __slots__ = ("address",)
+
+    def __init__(self, size: int) -> None:
+        # malloc(0) is allowed to return NULL
+        address = c_malloc(size or 1)
+
+        if not address:
+            raise AllocationError("failed to allocate memory")
+
+        self.address: int = address
+
+    def resize(self, size: int) -> None:
+        address = c_realloc(self.address, size or 1)
+
+        if not address:
+            raise AllocationError("failed to allocate memory")
+
+        self.address = address
+
+    def __del__(self) -> None:
+        # __init__ may have failed before the memory existed
+        if getattr(self, "address", None):
+            c_free(self.address)
+
+
+# elements converted at a time when building an array from an iterator
+_CHUNK_SIZE = 4096
+# ctypes types of struct module formats, for arrays built from buffers
+_FORMAT_TYPES: Dict[str, Type["ctypes._CData"]] = {
+    "?": ctypes.c_bool,
+    "b": ctypes.c_byte,
+    "B": ctypes.c_ubyte,
+    "h": ctypes.c_short,
+    "H": ctypes.c_ushort,
+    "i": ctypes.c_int,
+    "I": ctypes.c_uint,
+    "l": ctypes.c_long,
+    "L": ctypes.c_ulong,
+    "q": ctypes.c_longlong,
+    "Q": ctypes.c_ulonglong,
+    "f": ctypes.c_float,
+    "d": ctypes.c_double,
+    "g": ctypes.c_longdouble,
+}
+
+
+def _format_type(fmt: str) -> Type["ctypes._CData"]:
+    native = "<" if sys.byteorder == "little" else ">"
+    ctype = _FORMAT_TYPES.get(fmt.lstrip("@=" + native))
+
+    if not ctype:
+        raise TypeError(
+            f"cannot infer the element type of a buffer with format {fmt!r}, pass a dtype",  # noqa
+        )
+
+    return ctype
+
+
+def _array_from_buffer(
+    view: memoryview,
+    dtype: Optional[Type[T]],
+) -> CArrayPointer[T]:
+    if dtype is None:
+        ctype = _format_type(view.format)
+        typ: Any = _ELEMENT_TYPES.get(ctype, ctype)
+    else:
+        ctype = get_mapped(dtype)
+        typ = dtype
+
+    if ctype in _NON_NUMERIC:
+        raise TypeError(
+            f"cannot create an array of {typ.__name__} from a buffer",
+        )
+
+    itemsize = ctypes.sizeof(ctype)
+
+    if view.nbytes % itemsize:
+        raise ValueError(
+            f"buffer size ({view.nbytes}) is not a multiple of the element size ({itemsize})",  # noqa
+        )
+
+    memory = _CArrayMemory(view.nbytes)
+    ptr = CArrayPointer(
+        memory.address,
+        view.nbytes,
+        view.nbytes // itemsize,
+        typ,
+        owner=memory,
+    )
+    ptr._copy_buffer(view)
+    return ptr
+
+
+def _array_from_iterable(
+    source: Iterable[T],
+    dtype: Optional[Type[T]],
+) -> CArrayPointer[T]:
+    if isinstance(source, (list, tuple)):
+        chunk = list(source)
+        rest: Iterator[T] = iter(())
+    else:
+        rest = iter(source)
+        chunk = list(islice(rest, _CHUNK_SIZE))
+
+    if dtype is None:
+        if not chunk:
+            raise ValueError("cannot infer the element type of an empty iterable")  # noqa
+
+        dtype = type(chunk[0])
+
+    ctype = get_mapped(dtype)
+    itemsize = ctypes.sizeof(ctype)
+
+    if ctype in _NON_NUMERIC:
+        # the elements need references that live as long as the pointer,
+        # so they have to be set through its own ctypes array
+        chunk.extend(rest)
+        memory = _CArrayMemory(len(chunk) * itemsize)
+        ptr = CArrayPointer(
+            memory.address,
+            len(chunk) * itemsize,
+            len(chunk),
+            dtype,
+            owner=memory,
+        )
+        ptr._get_elements()[:] = chunk
+        return ptr
+
+    capacity = len(chunk)
+    memory = _CArrayMemory(capacity * itemsize)
+    length = 0
+
+    while chunk:
+        count = len(chunk)
+
+        if length + count > capacity:
+            capacity = max(capacity * 2, length + count)
+            memory.resize(capacity * itemsize)
+
+        elements = (ctype * count).from_address(
+            memory.address + length * itemsize,
+        )
+        elements[:] = chunk
+        length += count
+        chunk = list(islice(rest, _CHUNK_SIZE))
+
+    if length != capacity:
+        memory.resize(length * itemsize)
 
     return CArrayPointer(
-        ctypes.addressof(arr),
-        ctypes.sizeof(arr),
+        memory.address,
+        length * itemsize,
         length,
-        f_type,  # type: ignore
+        dtype,
+        owner=memory,
     )
 
 
+@handle
+def array_from(
+    source: Iterable[T],
+    dtype: Optional[Type[T]] = None,
+) -> CArrayPointer[T]:
+    """Create an array from an iterable or an object supporting the buffer protocol.
+
+    Buffers are copied with a single `memmove`, and other iterables are converted a chunk at a time, so generators are never turned into one large list.
+
+    Args:
+        source: Elements of the array.
+        dtype: Type of every element. By default, it's inferred from the buffer format or the first element.
+
+    Returns:
+        Pointer to the array. It owns the memory, which is freed once the pointer (and every slice of it) has been garbage collected.
+
+    Raises:
+        TypeError: The element type could not be inferred, or does not fit a buffer.
+        ValueError: The buffer size does not match the element size, or the iterable is empty and no type was given.
+
+    Example:
+        ```py
+        squares = array_from((i * i for i in range(100_000)), int)
+        data = array_from(array.array("d", [1.5, 2.5]))
+        ```
+    """  # noqa
+    try:
+        view = memoryview(source)  # type: ignore
+    except TypeError:
+        return _array_from_iterable(source, dtype)
+
+    with view:
+        return _array_from_buffer(view, dtype)
+
+
 def to_func_ptr(fn: Callable[P, T]) -> FunctionPointer[P, T]:
     return FunctionPointer(id(fn))  # type: ignore
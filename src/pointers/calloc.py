@@ -1,26 +1,31 @@
-from typing import Dict, Iterator, Optional, TypeVar
+from typing import Iterator, Optional, Tuple, TypeVar
 
 from ._cstd import c_calloc, c_free
-from .exceptions import AllocationError, DereferenceError
+from .exceptions import AllocationError
 from .util import handle
 from .base_pointers import BaseAllocatedPointer
+from .malloc import _AllocationRecord
 
 __all__ = ("AllocatedArrayPointer", "calloc")
 
 T = TypeVar("T")
 
 
-# FOR FUTURE REFERENCE:
+class _ArrayRecord(_AllocationRecord):
+    """Allocation record shared by every element view of a `calloc` array."""
 
-# _chunk_store is needed to hold each index in the pointer array accordingly.
-# We can't just lookup each index via a memory offset,
-# since we can't verify that the memory actually contains something.
+    __slots__ = ("chunk_size", "assigned")
 
-# If the memory is empty, then Python will segfault as it can't convert it to
-# a PyObject*.
+    def __init__(self, address: int, chunks: int, chunk_size: int) -> None:
+        super().__init__(address, chunks * chunk_size)
+        self.chunk_size = chunk_size
+        # zeroed memory isn't a valid object, so dereferencing an element
+        # is only allowed once something has been moved into it
+        self.assigned = bytearray(chunks)
 
-
-# TODO: make this implementation better
+    @property
+    def chunks(self) -> int:
+        return self.size // self.chunk_size
 
 
 class AllocatedArrayPointer(BaseAllocatedPointer[T]):
@@ -31,27 +36,37 @@ class AllocatedArrayPointer(BaseAllocatedPointer[T]):
         address: int,
         chunks: int,
         chunk_size: int,
-        current_index: int,
-        chunk_store: Optional[Dict[int, "AllocatedArrayPointer[T]"]] = None,
-        freed: bool = False,
-        origin_address: Optional[int] = None,
+        current_index: int = 0,
+        *,
+        record: Optional[_ArrayRecord] = None,
     ) -> None:
-        self._origin_address = origin_address or address
-        self._address = address
-        self._size = chunk_size
+        """
+        Args:
+            address: Address of the start of the array.
+            chunks: Number of elements in the array.
+            chunk_size: Size of each element.
+            current_index: Element that the pointer points to.
+        """
+        self._record = record or _ArrayRecord(address, chunks, chunk_size)
         self._current_index = current_index
-        self._chunks = chunks
-        self._chunk_store = chunk_store or {0: self}
-        self._assigned = True
-        self._tracked = False
-        self._freed = freed
-
-        if chunk_store:
-            self._chunk_store[self.current_index] = self
 
     @property  # type: ignore
     def address(self) -> Optional[int]:
-        return self._address
+        record = self._record
+        return record.address + (self._current_index * record.chunk_size)
+
+    @property  # type: ignore
+    def size(self) -> int:
+        # the allocation itself is resized through realloc
+        return self._record.chunk_size
+
+    @property
+    def assigned(self) -> bool:
+        return bool(self._record.assigned[self._current_index])
+
+    @assigned.setter
+    def assigned(self, value: bool) -> None:
+        self._record.assigned[self._current_index] = value
 
     @property
     def current_index(self) -> int:
@@ -61,10 +76,10 @@ class AllocatedArrayPointer(BaseAllocatedPointer[T]):
     @property
     def chunks(self) -> int:
         """Number of allocated chunks."""
-        return self._chunks
+        return self._record.chunks
 
     def _get_chunk_at(self, index: int) -> "AllocatedArrayPointer[T]":
-        if index > self.chunks:
+        if index >= self.chunks:
             raise IndexError(
                 f"index is {index}, while allocation is {self.chunks}",
             )
@@ -72,18 +87,14 @@ class AllocatedArrayPointer(BaseAllocatedPointer[T]):
         if index < 0:  # for handling __sub__
             raise IndexError("index is below zero")
 
-        if index not in self._chunk_store:
-            self._chunk_store[index] = AllocatedArrayPointer(
-                self._origin_address + (index * self.size),
-                self.chunks,
-                self.size,
-                index,
-                self._chunk_store,
-                self._freed,
-                self._origin_address,
-            )
-
-        return self._chunk_store[index]
+        record = self._record
+        return AllocatedArrayPointer(
+            record.address,
+            record.chunks,
+            record.chunk_size,
+            index,
+            record=record,
+        )
 
     def __add__(self, amount: int) -> "AllocatedArrayPointer[T]":
         self.ensure_valid()
@@ -97,7 +108,7 @@ class AllocatedArrayPointer(BaseAllocatedPointer[T]):
 
     def __iter__(self) -> Iterator["AllocatedArrayPointer[T]"]:
         for i in range(self.current_index, self.chunks):
-            yield self + i
+            yield self._get_chunk_at(i)
 
     def __getitem__(self, index: int) -> "AllocatedArrayPointer[T]":
         return self._get_chunk_at(index)
@@ -106,20 +117,60 @@ class AllocatedArrayPointer(BaseAllocatedPointer[T]):
         chunk = self._get_chunk_at(index)
         chunk <<= value
 
+    def _resized(self, address: int, size: int) -> None:
+        record = self._record
+        chunks = size // record.chunk_size
+        assigned = record.assigned[:chunks]
+        assigned.extend(bytes(chunks - len(assigned)))
+
+        if address != record.address:
+            # the old block is gone, so are any views into it
+            record.freed = True
+            self._record = _ArrayRecord(address, chunks, record.chunk_size)
+            self._record.assigned = assigned
+        else:
+            record.size = size
+            record.assigned = assigned
+
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        # the buffer covers every element from the current one onwards
+        self.ensure_valid()
+        record = self._record
+        record.exports += 1
+        return (
+            self.ensure(),
+            (record.chunks - self._current_index) * record.chunk_size,
+            1,
+            "B",
+            False,
+        )
+
+    def _release_buffer(self) -> None:
+        self._record.exports -= 1
+
+    @property
+    def _exports(self) -> int:
+        return self._record.exports
+
     @property
     def freed(self) -> bool:
-        return self._freed
+        return self._record.freed
+
+    @freed.setter
+    def freed(self, value: bool) -> None:
+        self._record.freed = value
 
     @handle
     def free(self) -> None:
-        first = self[0]
-        first.ensure_valid()
+        self.ensure_valid()
 
-        for i in range(self._chunks):  # using __iter__ breaks here
-            chunk = self._get_chunk_at(i)
-            chunk._freed = True
+        if self._record.exports:
+            raise BufferError(
+                "cannot free memory while a buffer of it is exported",
+            )
 
-        c_free(first.make_ct_pointer())
+        c_free(self._record.address)
+        self.freed = True
 
 
 def calloc(num: int, size: int) -> AllocatedArrayPointer:
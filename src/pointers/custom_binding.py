@@ -21,7 +21,20 @@ def binds(
     dll_func: "_NamedFuncPointer",
     *,
     struct: Optional[Type["Struct"]] = None,
+    keep_alive: bool = False,
 ):
+    """Create a binding to a C function from a type hinted Python function.
+
+    Python functions passed as callbacks are converted to C function pointers,
+    which are cached and only kept alive for the latest 256 callbacks. If the
+    C function holds on to a callback after returning (e.g. `atexit` or
+    `pthread_create`), pass `keep_alive=True` so it is never released.
+
+    Args:
+        dll_func: C function to bind to.
+        struct: Struct type returned by the function.
+        keep_alive: Keep callbacks passed to the function alive forever.
+    """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -53,6 +66,7 @@ def binds(
                 }
                 if struct
                 else None,
+                keep_alive=keep_alive,
             )
 
         return wrapper
@@ -63,8 +77,14 @@ def binds(
 def binding(
     dll_func: "_NamedFuncPointer",
     struct: Optional[Type["Struct"]] = None,
+    *,
+    keep_alive: bool = False,
 ):
-    @binds(dll_func, struct=struct)
+    """Create a binding to a C function without type hints.
+
+    See `binds` for `keep_alive`."""
+
+    @binds(dll_func, struct=struct, keep_alive=keep_alive)
     def wrapper(*args, **kwargs) -> Any:
         ...
 
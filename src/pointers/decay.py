@@ -1,7 +1,6 @@
 import inspect
-from contextlib import suppress
 from functools import wraps
-from typing import Any, Callable, Dict, Tuple, TypeVar
+from typing import Any, Callable, Optional, Tuple, TypeVar
 
 from typing_extensions import Annotated, ParamSpec, get_args, get_origin, get_type_hints
 
@@ -13,37 +12,71 @@ P = ParamSpec("P")
 __all__ = ("decay", "decay_annotated", "decay_wrapped")
 
 
-def _make_func_params(
-    func: Callable[P, Any],
-    args: Tuple[Any, ...],
-    kwargs: Dict[str, Any],
-) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    hints = get_type_hints(func, include_extras=True)
-    actual: dict = {}
-    params = inspect.signature(func).parameters
+# parameters to decay as (position, name), keyword-only ones have no position
+_Positions = Tuple[Tuple[Optional[int], str], ...]
+
+_POSITIONAL = {
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+}
+
+
+def _is_pointer(hint: Any) -> bool:
+    return (hint is Pointer) or (get_origin(hint) is Pointer)
 
-    for index, key in enumerate(params):
-        if key in kwargs:
-            actual[key] = kwargs[key]
-        else:
-            with suppress(IndexError):
-                actual[params[key].name] = args[index]
 
-    return (hints, actual)
+def _is_annotated_pointer(hint: Any) -> bool:
+    return (get_origin(hint) is Annotated) and _is_pointer(get_args(hint)[1])
 
 
-def _decay_params(
+def _decay_positions(
     func: Callable[..., Any],
-    args: Tuple[Any, ...],
-    kwargs: Dict[str, Any],
-) -> Dict[str, Any]:
-    hints, actual = _make_func_params(func, args, kwargs)
+    should_decay: Callable[[Any], bool],
+) -> _Positions:
+    hints = get_type_hints(func, include_extras=True)
+    positions = []
+
+    for index, param in enumerate(inspect.signature(func).parameters.values()):
+        if param.kind in {param.VAR_POSITIONAL, param.VAR_KEYWORD}:
+            continue
+
+        if (param.name in hints) and should_decay(hints[param.name]):
+            positions.append(
+                (index if param.kind in _POSITIONAL else None, param.name),
+            )
+
+    return tuple(positions)
+
+
+def _make_decayer(
+    func: Callable[..., T],
+    should_decay: Callable[[Any], bool],
+) -> Callable[..., T]:
+    # hints are resolved on the first call instead of at decoration, since
+    # they may reference names that don't exist yet
+    positions: Optional[_Positions] = None
+
+    @wraps(func)
+    def inner(*args: Any, **kwargs: Any) -> T:
+        nonlocal positions
+
+        if positions is None:
+            positions = _decay_positions(func, should_decay)
+
+        if positions:
+            args_list = list(args)
 
-    for key, value in hints.items():
-        if (get_origin(value) is Pointer) or (value is Pointer):
-            actual[key] = to_ptr(actual[key])
+            for index, name in positions:
+                if (index is not None) and (index < len(args_list)):
+                    args_list[index] = to_ptr(args_list[index])
+                elif name in kwargs:
+                    kwargs[name] = to_ptr(kwargs[name])
 
-    return actual
+            return func(*args_list, **kwargs)
+
+        return func(*args, **kwargs)
+
+    return inner
 
 
 def decay(func: Callable[P, T]) -> Callable[..., T]:
@@ -59,12 +92,7 @@ def decay(func: Callable[P, T]) -> Callable[..., T]:
         ```
     """
 
-    @wraps(func)
-    def inner(*args: P.args, **kwargs: P.kwargs) -> T:
-        actual = _decay_params(func, args, kwargs)
-        return func(**actual)  # type: ignore
-
-    return inner
+    return _make_decayer(func, _is_pointer)
 
 
 def decay_annotated(func: Callable[P, T]) -> Callable[P, T]:
@@ -79,22 +107,7 @@ def decay_annotated(func: Callable[P, T]) -> Callable[P, T]:
         ```
     """
 
-    @wraps(func)
-    def wrapped(*args: P.args, **kwargs: P.kwargs):
-        hints, actual = _make_func_params(func, args, kwargs)
-
-        for param, hint in hints.items():
-            if get_origin(hint) is not Annotated:
-                continue
-
-            hint_arg = get_args(hint)[1]
-
-            if (hint_arg is Pointer) or (get_origin(hint_arg) is Pointer):
-                actual[param] = to_ptr(actual[param])
-
-        return func(**actual)  # type: ignore
-
-    return wrapped
+    return _make_decayer(func, _is_annotated_pointer)
 
 
 def decay_wrapped(_: Callable[P, T]) -> Callable[..., Callable[P, T]]:
@@ -114,11 +127,6 @@ def decay_wrapped(_: Callable[P, T]) -> Callable[..., Callable[P, T]]:
     """
 
     def decorator(func: Callable[..., T]) -> Callable[P, T]:
-        @wraps(func)
-        def wrapped(*args: P.args, **kwargs: P.kwargs):
-            actual = _decay_params(func, args, kwargs)
-            return func(**actual)
-
-        return wrapped
+        return _make_decayer(func, _is_pointer)
 
     return decorator  # type: ignore
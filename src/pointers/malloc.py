@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import sys
-from typing import Any, Optional, TypeVar
+from typing import Any, List, Optional, Tuple, TypeVar
+
+from typing_extensions import Protocol
 
 from ._cstd import c_free, c_malloc, c_realloc
 from .base_pointers import BaseAllocatedPointer, IterDereferencable
@@ -16,6 +18,38 @@ T = TypeVar("T")
 A = TypeVar("A", bound=BaseAllocatedPointer)
 
 
+class _Owner(Protocol):
+    """Allocator that a sub-allocation is returned to instead of libc."""
+
+    # buffers of any of its sub-allocations that are still alive
+    _exports: int
+
+    @property
+    def freed(self) -> bool:
+        ...
+
+    def release(self, record: _AllocationRecord) -> None:
+        ...
+
+
+class _AllocationRecord:
+    """State shared by an allocation and every view derived from it."""
+
+    __slots__ = ("address", "size", "freed", "owner", "exports")
+
+    def __init__(
+        self,
+        address: int,
+        size: int,
+        owner: _Owner | None = None,
+    ) -> None:
+        self.address = address
+        self.size = size
+        self.freed = False
+        self.owner = owner
+        self.exports = 0
+
+
 class AllocatedPointer(IterDereferencable[T], BaseAllocatedPointer[T]):
     """Pointer to allocated memory."""
 
@@ -24,43 +58,82 @@ class AllocatedPointer(IterDereferencable[T], BaseAllocatedPointer[T]):
         address: int,
         size: int,
         assigned: bool = False,
-        parent: AllocatedPointer[T] | None = None,
+        owner: _Owner | None = None,
+        *,
+        record: _AllocationRecord | None = None,
     ) -> None:
         """
         Args:
             address: Address of the allocated memory.
             size: Size of the allocated memory.
             assigned: Whether an object is currently inside the memory.
-        """
+            owner: Allocator that the memory is released to, if it didn't come from `malloc`.
+        """  # noqa
         self._address = address
         self._size = size
-        self._freed = False
         self._assigned = assigned
-        self._parent: AllocatedPointer[T] | None = parent
+        self._record = record or _AllocationRecord(address, size, owner)
+        # records counting each live export, released in any order
+        self._exported: List[_AllocationRecord] = []
 
     def _indexed(self, amount: int) -> AllocatedPointer[T]:
+        record = self._record
+        address = self.ensure() + amount
+        end = record.address + record.size
+
+        if not (record.address <= address < end):
+            raise IndexError(
+                f"offset {address - record.address} is out of bounds for an allocation of size {record.size}",  # noqa
+            )
+
         return AllocatedPointer(
-            self.ensure() + amount,
-            self.size - amount,
+            address,
+            end - address,
             self.assigned,
-            parent=self._parent,
+            record=record,
         )
 
-    def _get_parent(self) -> AllocatedPointer[T]:
-        parent = self
+    def _resized(self, address: int, size: int) -> None:
+        if address != self._record.address:
+            # the old block is gone, so are any views into it
+            self._record.freed = True
+            self._record = _AllocationRecord(address, size)
+        else:
+            self._record.size = size
+
+        self.address = address
+        self.size = size
+
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        info = super()._export_buffer()
+        record = self._record
+        record.exports += 1
+        self._exported.append(record)
+
+        if record.owner:
+            record.owner._exports += 1
 
-        while parent._parent:
-            parent = parent._parent
+        return info
 
-        return parent
+    def _release_buffer(self) -> None:
+        record = self._exported.pop()
+        record.exports -= 1
+
+        if record.owner:
+            record.owner._exports -= 1
+
+    @property
+    def _exports(self) -> int:
+        return self._record.exports
 
     @property
     def freed(self) -> bool:
-        return self._get_parent()._freed
+        record = self._record
+        return record.freed or bool(record.owner and record.owner.freed)
 
     @freed.setter
     def freed(self, value: bool) -> None:
-        self._get_parent()._freed = value
+        self._record.freed = value
 
     @property
     def address(self) -> Optional[int]:
@@ -77,12 +150,23 @@ class AllocatedPointer(IterDereferencable[T], BaseAllocatedPointer[T]):
         return self._indexed(amount)
 
     def __sub__(self, amount: int) -> AllocatedPointer[T]:
-        return self._indexed(amount)
+        return self._indexed(-amount)
 
     @handle
     def free(self) -> None:
         self.ensure_valid()
-        c_free(self.make_ct_pointer())
+        record = self._record
+
+        if record.exports:
+            raise BufferError(
+                "cannot free memory while a buffer of it is exported",
+            )
+
+        if record.owner:
+            record.owner.release(record)
+        else:
+            c_free(record.address)
+
         self.freed = True
 
     @handle
@@ -146,11 +230,11 @@ def free(target: BaseAllocatedPointer):
 
 @handle
 def realloc(target: A, size: int) -> A:
-    """Resize a memory block created by malloc.
+    """Resize a memory block created by malloc or calloc.
 
     Args:
         target: Pointer to reallocate.
-        size: New allocation size.
+        size: New allocation size. For a calloc array, this is the size of the whole array.
 
     Returns:
         Original object.
@@ -158,6 +242,8 @@ def realloc(target: A, size: int) -> A:
     Raises:
         InvalidSizeError: Object inside allocation is larger than attempted reallocation.
         AllocationError: Raised when allocation fails, presumably due to no memory.
+        BufferError: A buffer of the memory is still exported.
+        ValueError: The pointer is not at the start of the allocation, or the array size is not a multiple of its element size.
 
     Example:
         ```py
@@ -165,12 +251,41 @@ def realloc(target: A, size: int) -> A:
         realloc(ptr, 2)
         ```
     """  # noqa
+    from .calloc import AllocatedArrayPointer
+
     if type(target) is StackAllocatedPointer:
         raise TypeError("pointers to items on the stack may not be resized")
 
-    tsize: int = sys.getsizeof(~target)
+    if isinstance(target, AllocatedArrayPointer):
+        if target.current_index:
+            raise ValueError(
+                "only the start of an allocation may be resized",
+            )
 
-    if target.assigned and (tsize > size):
+        if size % target.size:
+            raise ValueError(
+                f"size of an array must be a multiple of its element size ({target.size})",  # noqa
+            )
+
+    if isinstance(target, AllocatedPointer):
+        if target._record.owner:
+            raise TypeError(
+                "memory handed out by an arena or pool may not be resized",
+            )
+
+        if target.address != target._record.address:
+            raise ValueError(
+                "only the start of an allocation may be resized",
+            )
+
+    if target._exports:
+        raise BufferError(
+            "cannot resize memory while a buffer of it is exported",
+        )
+
+    tsize: int = sys.getsizeof(~target) if target.assigned else 0
+
+    if tsize > size:
         raise InvalidSizeError(
             f"object inside memory is of size {tsize}, so memory cannot be set to size {size}",  # noqa
         )
@@ -180,6 +295,10 @@ def realloc(target: A, size: int) -> A:
     if not addr:
         raise AllocationError("failed to resize memory")
 
-    target.size = size
-    target.address = addr
+    if isinstance(target, (AllocatedPointer, AllocatedArrayPointer)):
+        target._resized(addr, size)
+    else:
+        target.size = size
+        target.address = addr
+
     return target
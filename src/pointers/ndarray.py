@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import ctypes
+from typing import TYPE_CHECKING, Any, Optional
+
+from ._utils import _C_TYPES, get_mapped
+from .c_pointer import _ELEMENT_TYPES, _NON_NUMERIC, CArrayPointer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ("array_from_ndarray",)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for ndarray support, install it with `pip install pointers.py[numpy]`"  # noqa
+        ) from e
+
+    return numpy
+
+
+def _to_dtype(typ: Any) -> "np.dtype[Any]":
+    np = _import_numpy()
+
+    if isinstance(typ, type) and (
+        (typ in _C_TYPES)
+        or issubclass(typ, ctypes._SimpleCData)  # type: ignore
+    ):
+        ctype = get_mapped(typ)
+
+        if ctype in _NON_NUMERIC:
+            raise TypeError(f"{typ.__name__} cannot be used as an array type")
+
+        typ = ctype
+
+    dtype = np.dtype(typ)
+
+    if dtype.hasobject:
+        raise TypeError(f"{dtype} cannot be used as an array type")
+
+    return dtype
+
+
+def _as_ndarray(ptr: Any, dtype: Any) -> "np.ndarray[Any, Any]":
+    np = _import_numpy()
+    dtype = _to_dtype(dtype)
+    # the memoryview holds a buffer export, which keeps the pointer (and
+    # for allocations, the memory) alive for as long as the array is
+    view = memoryview(ptr)
+    return np.frombuffer(view, dtype, view.nbytes // dtype.itemsize)
+
+
+def array_from_ndarray(arr: "np.ndarray[Any, Any]") -> CArrayPointer[Any]:
+    """Create an array pointer to the data of an existing ndarray.
+
+    No data is copied, writes through the pointer show up in the ndarray and vice versa.
+
+    Args:
+        arr: C contiguous ndarray to point to. Multi-dimensional arrays are flattened.
+
+    Returns:
+        Pointer to the data of the ndarray, which keeps the ndarray alive.
+
+    Raises:
+        TypeError: The array type has no C equivalent.
+        ValueError: The array is not C contiguous or is read only.
+
+    Example:
+        ```py
+        arr = numpy.arange(10, dtype=numpy.int32)
+        ptr = array_from_ndarray(arr)
+        print(ptr[3])  # 3
+        ```
+    """  # noqa
+    np = _import_numpy()
+
+    if not isinstance(arr, np.ndarray):
+        raise TypeError(f"expected an ndarray, got {type(arr).__name__}")
+
+    if not arr.flags.c_contiguous:
+        raise ValueError("array must be C contiguous")
+
+    if not arr.flags.writeable:
+        raise ValueError("array must be writeable")
+
+    if (not arr.dtype.isnative) or arr.dtype.hasobject:
+        raise TypeError(f"{arr.dtype} cannot be used as an array type")
+
+    try:
+        ctype = np.ctypeslib.as_ctypes_type(arr.dtype)
+    except NotImplementedError as e:
+        raise TypeError(f"{arr.dtype} has no C equivalent") from e
+
+    if not issubclass(ctype, ctypes._SimpleCData):  # type: ignore
+        raise TypeError(f"{arr.dtype} cannot be used as an array type")
+
+    typ: Optional[type] = _ELEMENT_TYPES.get(ctype)
+
+    return CArrayPointer(
+        arr.ctypes.data,
+        arr.nbytes,
+        arr.size,
+        typ or ctype,
+        owner=arr,
+    )
@@ -1,19 +1,25 @@
 import ctypes
 import sys
-from typing import TypeVar, Union
+from typing import Iterable, Optional, TypeVar, Union
 
-from _pointers import add_ref, remove_ref, set_ref
+from _pointers import pointer_array, set_ref
 
 from .base_pointers import NULL, BaseObjectPointer, BasePointer, Nullable
 from .exceptions import InvalidSizeError
 from .util import handle
 
+__all__ = ("Pointer", "PointerArray", "to_ptr", "to_ptrs", "deref_many")
+
 T = TypeVar("T")
 
+_PY_OBJECT_P = ctypes.POINTER(ctypes.py_object)
+
 
 class Pointer(BaseObjectPointer[T]):
     """Pointer to a `PyObject`"""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"Pointer(address={self.address})"
 
@@ -39,9 +45,16 @@ class Pointer(BaseObjectPointer[T]):
         refcnt = sys.getrefcount(deref_b)
         refcnt_a = sys.getrefcount(deref_a)
 
-        if (self._origin_size < size_a) and (not unsafe):
+        if self._origin_size is None:
+            # only measured once, before anything has been moved in
+            self._origin_size = size_b
+
+        # neither the original target nor the current one may be overrun
+        limit = min(self._origin_size, size_b)
+
+        if (limit < size_a) and (not unsafe):
             raise InvalidSizeError(
-                f"target size may not exceed current size ({size_a} < {size_b})",  # noqa
+                f"target size may not exceed current size ({size_a} < {limit})",  # noqa
             )
 
         if type(deref_a) is not type(deref_b):
@@ -50,20 +63,17 @@ class Pointer(BaseObjectPointer[T]):
             )
 
         current_address: int = self.ensure()
-        bytes_a = (ctypes.c_ubyte * size_a).from_address(data.ensure())
-        bytes_b = (ctypes.c_ubyte * size_b).from_address(current_address)
 
         self.assign(~data)
-        ctypes.memmove(bytes_b, bytes_a, len(bytes_a))
+        ctypes.memmove(current_address, data.ensure(), size_a)
         set_ref(deref_b, (refcnt - 1) + (refcnt_a - 2))
 
     @classmethod
     def make_from(cls, obj: Nullable[T]) -> "Pointer[T]":
-        is_null = obj is NULL
-        return Pointer(
-            id(obj) if not is_null else None,
-            not is_null,
-        )
+        if obj is NULL:
+            return Pointer(None)
+
+        return Pointer(id(obj), True)
 
 
 @handle
@@ -83,7 +93,67 @@ def to_ptr(obj: Nullable[T]) -> Pointer[T]:
         something_ptr = to_ptr(something)  # points to 2, not "something"
         ```
     """
-    add_ref(obj)
-    ptr = Pointer.make_from(obj)
-    remove_ref(obj)
-    return ptr
+    return Pointer.make_from(obj)
+
+
+class PointerArray(pointer_array):
+    """Contiguous array of `PyObject*`, each owning a reference to its target.
+
+    Items are only dereferenced when they are accessed, so this is much
+    smaller than a list of `Pointer` objects. Indexing, slicing and iteration
+    return the objects themselves, and slices are new arrays.
+
+    The array can be passed to bindings expecting a `PyObject**`.
+
+    Example:
+        ```py
+        ptrs = PointerArray(["a", "b", "c"])
+        ptrs[0] = "d"
+        print(list(ptrs[:2]))  # ['d', 'b']
+        ```"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"PointerArray(address={self.address}, length={len(self)})"
+
+    @property
+    def _as_parameter_(self) -> "ctypes._PointerLike":
+        return ctypes.cast(self.address, _PY_OBJECT_P)
+
+
+def to_ptrs(objects: Iterable[T]) -> PointerArray:
+    """Point to every object in an iterable at once.
+
+    Args:
+        objects: Objects to point to.
+
+    Returns:
+        Array holding a pointer to each object.
+
+    Example:
+        ```py
+        ptrs = to_ptrs(["a", "b", "c"])
+        print(ptrs[1])  # b
+        ```
+    """
+    return PointerArray(objects)
+
+
+def deref_many(addresses: Iterable[Optional[int]]) -> PointerArray:
+    """Point to the objects at many addresses at once.
+
+    Args:
+        addresses: Addresses of the objects, or `None` for a NULL pointer.
+
+    Returns:
+        Array holding a pointer to each object.
+
+    Example:
+        ```py
+        a = "hello"
+        ptrs = deref_many([id(a)])
+        print(ptrs[0])  # hello
+        ```
+    """
+    return PointerArray._from_addresses(addresses)
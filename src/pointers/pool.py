@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+from typing import Any, Dict, List
+
+from ._cstd import c_free, c_malloc
+from .exceptions import AllocationError, FreedMemoryError
+from .malloc import AllocatedPointer, _AllocationRecord, malloc
+
+__all__ = ("Pool", "pool_malloc")
+
+_WORD = ctypes.sizeof(ctypes.c_void_p)
+
+
+class Pool:
+    """Allocator recycling blocks of a single size through a free list.
+
+    Freed blocks store the address of the next free block in their first
+    bytes, so the free list needs no memory of its own. The free list is
+    guarded by a lock, so a pool can be shared between threads.
+
+    Example:
+        ```py
+        with Pool(28, 64) as pool:
+            ptr = pool.allocate()
+            ptr <<= 1
+            free(ptr)  # goes back to the pool, not to libc
+        ```
+    """
+
+    def __init__(self, block_size: int, capacity: int = 64) -> None:
+        """
+        Args:
+            block_size: Size of every block in the pool.
+            capacity: Number of blocks in each chunk requested from `malloc`.
+        """  # noqa
+        if block_size <= 0:
+            raise ValueError("block size must be positive")
+
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._block_size = block_size
+        # blocks have to be able to hold a free list link
+        self._stride = max(_WORD, -(-block_size // _WORD) * _WORD)
+        self._capacity = capacity
+        self._chunks: List[int] = []
+        self._free_list = 0
+        # unused tail of the newest chunk, carved lazily
+        self._next_block = 0
+        self._chunk_end = 0
+        self._in_use = 0
+        self._exports = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def block_size(self) -> int:
+        """Size of every block in the pool."""
+        return self._block_size
+
+    @property
+    def capacity(self) -> int:
+        """Number of blocks in each chunk."""
+        return self._capacity
+
+    @property
+    def chunks(self) -> int:
+        """Number of chunks requested from `malloc`."""
+        return len(self._chunks)
+
+    @property
+    def total_blocks(self) -> int:
+        """Number of blocks across all chunks."""
+        return len(self._chunks) * self._capacity
+
+    @property
+    def in_use(self) -> int:
+        """Number of blocks currently handed out."""
+        return self._in_use
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the blocks that are currently handed out."""
+        total = self.total_blocks
+        return (self._in_use / total) if total else 0.0
+
+    @property
+    def freed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def __repr__(self) -> str:
+        return f"Pool(block_size={self.block_size}, in_use={self.in_use}, total_blocks={self.total_blocks})"  # noqa
+
+    def _grow(self) -> None:
+        size = self._stride * self._capacity
+        address = c_malloc(size)
+
+        if not address:
+            raise AllocationError("failed to allocate memory")
+
+        self._chunks.append(address)
+        self._next_block = address
+        self._chunk_end = address + size
+
+    def allocate(self) -> AllocatedPointer[Any]:
+        """Take a block from the pool.
+
+        Returns:
+            Pointer to the block. Calling `free` on it puts the block back into the pool.
+
+        Raises:
+            FreedMemoryError: The pool has been closed.
+            AllocationError: Raised when a new chunk could not be allocated.
+        """  # noqa
+        return AllocatedPointer(self._take(), self._block_size, owner=self)
+
+    def _take(self) -> int:
+        with self._lock:
+            if self._closed:
+                raise FreedMemoryError("pool has been closed")
+
+            address = self._free_list
+
+            if address:
+                self._free_list = (
+                    ctypes.c_void_p.from_address(address).value or 0
+                )
+            else:
+                if self._next_block == self._chunk_end:
+                    self._grow()
+
+                address = self._next_block
+                self._next_block += self._stride
+
+            self._in_use += 1
+            return address
+
+    def release(self, record: _AllocationRecord) -> None:
+        address = record.address
+
+        with self._lock:
+            ctypes.c_void_p.from_address(address).value = self._free_list
+            self._free_list = address
+            self._in_use -= 1
+
+    def close(self) -> None:
+        """Free every block and give the chunks back to libc.
+
+        Raises:
+            BufferError: A buffer of a block is still exported.
+        """
+        with self._lock:
+            if self._exports:
+                raise BufferError(
+                    "cannot close a pool while a buffer of it is exported",
+                )
+
+            for address in self._chunks:
+                c_free(address)
+
+            self._chunks.clear()
+            self._free_list = 0
+            self._next_block = 0
+            self._chunk_end = 0
+            self._in_use = 0
+            self._closed = True
+
+    def __enter__(self) -> Pool:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # __init__ may have failed before the chunks existed
+        if getattr(self, "_chunks", None):
+            self.close()
+
+
+# allocations above this size go straight to malloc
+_MAX_POOLED = 512
+_POOLS: Dict[int, Pool] = {}
+
+
+def pool_malloc(size: int) -> AllocatedPointer[Any]:
+    """Allocate memory of a given size from a shared pool of that size class.
+
+    Sizes are rounded up to a multiple of the pointer size, and every size
+    class gets its own `Pool`. Larger allocations fall back to `malloc`.
+
+    Args:
+        size: Allocation size.
+
+    Returns:
+        Pointer to allocated memory.
+
+    Raises:
+        AllocationError: Raised when allocation fails, presumably due to no memory.
+        ValueError: The size is negative.
+
+    Example:
+        ```py
+        ptr = pool_malloc(28)
+        free(ptr)
+        ```
+    """  # noqa
+    if size < 0:
+        raise ValueError("allocation size must not be negative")
+
+    if size > _MAX_POOLED:
+        return malloc(size)
+
+    size_class = max(_WORD, -(-size // _WORD) * _WORD)
+    pool = _POOLS.get(size_class)
+
+    if pool is None:
+        # another thread may have made the pool first
+        pool = _POOLS.setdefault(size_class, Pool(size_class))
+
+    return AllocatedPointer(pool._take(), size, owner=pool)
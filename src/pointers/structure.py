@@ -1,23 +1,113 @@
 import ctypes
-from contextlib import suppress
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+import warnings
+from operator import attrgetter
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Generic, Iterator,
+                    List, Optional, Tuple, Type, TypeVar, Union, cast,
+                    overload)
 
-from _pointers import add_ref
+from _pointers import buffer_exporter
 
 from ._utils import attempt_decode, get_mapped, get_py
 from .base_pointers import BaseCPointer
-from .c_pointer import TypedCPointer, VoidPointer
+from .c_pointer import (_ELEMENT_TYPES, CArrayPointer, TypedCPointer,
+                        VoidPointer, array_from)
 from .object_pointer import Pointer
 from .util import RawType, handle
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    # records are built on the ctypes structure of their struct
+    _RecordBase = ctypes.Structure
+else:
+    _RecordBase = object
+
 T = TypeVar("T", bound="Struct")
 
 __all__ = (
     "Struct",
     "StructPointer",
+    "StructArray",
 )
 
 
+class _Field(property):
+    """Accessor for a struct field, reading straight from the internal structure."""  # noqa
+
+    raw: Optional[Type["ctypes._CData"]] = None
+
+
+def _is_char_type(ct: Type["ctypes._CData"]) -> bool:
+    if issubclass(ct, ctypes.Array):
+        ct = ct._type_  # type: ignore
+
+    return ct in {ctypes.c_char, ctypes.c_char_p}
+
+
+def _converter(
+    ct: Type["ctypes._CData"],
+    void_p: bool,
+) -> Optional[Callable[[Any], Any]]:
+    # how a field value is converted is decided once, not on every read
+    if issubclass(ct, ctypes._Pointer):  # type: ignore
+        target = ct._type_  # type: ignore
+
+        def convert(value: Any) -> Any:
+            value = value.contents
+
+            if target is ctypes.c_void_p:
+                return VoidPointer(
+                    ctypes.addressof(value),
+                    ctypes.sizeof(value),
+                )
+
+            return TypedCPointer(
+                ctypes.addressof(value),
+                get_py(target),
+                ctypes.sizeof(value),
+                False,
+            )
+
+        return convert
+
+    if void_p:
+
+        def convert(value: Any) -> Any:
+            return VoidPointer(value, ctypes.sizeof(ctypes.c_void_p))
+
+        return convert
+
+    if _is_char_type(ct):
+
+        def convert(value: Any) -> Any:
+            return attempt_decode(value) if type(value) is bytes else value
+
+        return convert
+
+    return None
+
+
+def _converted(
+    read: Callable[[Any], Any],
+    convert: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    def get_field(self: Any) -> Any:
+        return convert(read(self))
+
+    return get_field
+
+
+def _field(name: str, ct: Type["ctypes._CData"], void_p: bool) -> _Field:
+    # plain values are read without any python frames
+    read = attrgetter(f"_struct.{name}")
+    convert = _converter(ct, void_p)
+
+    def set_field(self: Struct, value: Any) -> None:
+        setattr(self._struct, name, value)
+
+    return _Field(_converted(read, convert) if convert else read, set_field)
+
+
 class Struct:
     """Abstract class representing a struct."""
 
@@ -54,12 +144,16 @@ class Struct:
         if isinstance(attr, RawType):
             return attr.tp
 
+        if isinstance(attr, _Field) and attr.raw:
+            # inherited from a struct that declared a raw type
+            return attr.raw
+
         if ct is ctypes.c_void_p:
             cls._void_p.append(name)
 
         return ct
 
-    def __init__(self, *args: Any, do_sync: bool = True):
+    def __init__(self, *args: Any, do_sync: Optional[bool] = None):
         class_typ: Type[Struct] = type(self)
 
         if class_typ is Struct:
@@ -67,6 +161,13 @@ class Struct:
                 "cannot instantiate Struct directly",
             )
 
+        if do_sync is not None:
+            warnings.warn(
+                "do_sync is deprecated and has no effect, fields are only stored in the ctypes structure",  # noqa
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         self._existing_address: Optional[int] = None
         self._struct = self._internal_struct(
             *[
@@ -75,9 +176,6 @@ class Struct:
             ]
         )
 
-        if do_sync:
-            self._sync()
-
     def __init_subclass__(cls):
         hints = cls.__annotations__
         cls._void_p = []
@@ -98,6 +196,17 @@ class Struct:
 
         cls._internal_struct = _InternalStruct
 
+        for name, ct in _InternalStruct._fields_:
+            attr = getattr(cls, name, None)
+            field = _field(name, ct, name in cls._void_p)
+
+            if isinstance(attr, RawType) or (
+                isinstance(attr, _Field) and attr.raw
+            ):
+                field.raw = ct
+
+            setattr(cls, name, field)
+
     @property
     def _as_parameter_(self) -> ctypes.Structure:
         return self._struct
@@ -106,64 +215,21 @@ class Struct:
     def from_existing(cls, struct: ctypes.Structure) -> "Struct":
         """Build a new struct from an existing ctypes structure.
 
+        Nothing is copied, the fields are read from and written to `struct` directly.
+        The instance is created without calling `__init__`, so anything a subclass sets up there is skipped.
+
         Args:
             struct: Existing `ctypes.Structure` object
 
         Returns:
             Created struct object.
-        """
-        instance = cls(do_sync=False)
+        """  # noqa
+        instance = cls.__new__(cls)
         instance._struct = struct  # type: ignore
-        # mypy is getting angry here for whatever reason
-        instance._sync()
         instance._existing_address = ctypes.addressof(struct)
 
         return instance
 
-    @handle
-    def __getattribute__(self, name: str):
-        attr = super().__getattribute__(name)
-
-        with suppress(AttributeError):
-            hints = super().__getattribute__("_hints")
-
-            if (name in hints) and (type(attr)) is bytes:
-                attr = attempt_decode(attr)
-
-        if isinstance(attr, ctypes._Pointer):  # type: ignore
-            value = attr.contents
-            ct = type(value)
-
-            if ct is ctypes.c_void_p:
-                add_ref(ct)
-                return VoidPointer(
-                    ctypes.addressof(value),
-                    ctypes.sizeof(value),
-                )
-
-            py_type = get_py(ct)
-            return TypedCPointer(
-                ctypes.addressof(value),
-                py_type,
-                ctypes.sizeof(value),
-                False,
-            )
-
-        if name in super().__getattribute__("_void_p"):
-            ct = ctypes.c_void_p(attr)  # type: ignore
-            return VoidPointer(attr, ctypes.sizeof(ct))  # type: ignore
-
-        return attr
-
-    def __setattr__(self, name: str, value: Any):
-        if hasattr(self, "_struct"):
-            self._struct.__setattr__(name, value)
-        super().__setattr__(name, value)
-
-    def _sync(self) -> None:
-        for name in self._hints:
-            setattr(self, name, getattr(self._struct, name))
-
     def __repr__(self) -> str:
         return f"<struct {type(self).__name__} at {hex(ctypes.addressof(self._struct))}>"  # noqa
 
@@ -181,6 +247,8 @@ class Struct:
 class StructPointer(Pointer[T]):
     """Class representing a pointer to a struct."""
 
+    __slots__ = ("_existing",)
+
     def __init__(
         self,
         address: int,
@@ -209,3 +277,247 @@ class StructPointer(Pointer[T]):
 
     def get_existing_address(self) -> int:
         return (~self).get_existing_address()
+
+
+class StructRecord(Generic[T], _RecordBase):
+    """View of a single struct inside a `StructArray`.
+
+    Records are the array's own ctypes structures with the fields of the struct on top, so reading one allocates nothing but the structure.
+    """  # noqa
+
+    __slots__ = ()
+    _struct_type: Type[T]
+
+    def to_struct(self) -> T:
+        """Get a `Struct` sharing memory with the record."""
+        struct_type = self._struct_type
+        return struct_type.from_existing(  # type: ignore
+            struct_type._internal_struct.from_buffer(self),  # type: ignore
+        )
+
+    def __repr__(self) -> str:
+        return f"<record {self._struct_type.__name__} at {hex(ctypes.addressof(self))}>"  # type: ignore # noqa
+
+
+# specializations of StructArray, by struct type
+_STRUCT_ARRAYS: Dict[Type["Struct"], Type["StructArray[Any]"]] = {}
+
+
+def _specialize(struct_type: Type[T]) -> Type["StructArray[T]"]:
+    internal = struct_type._internal_struct
+    namespace: Dict[str, Any] = {"_struct_type": struct_type}
+
+    for field in internal._fields_:
+        name, ct = field[0], field[1]
+        convert = _converter(ct, name in struct_type._void_p)
+
+        # plain fields are inherited from the structure as they are
+        if convert:
+            base = internal.__dict__[name]
+            namespace[name] = property(
+                _converted(base.__get__, convert),
+                base.__set__,
+            )
+
+    record_type = type(
+        f"{struct_type.__name__}Record",
+        (internal, StructRecord),
+        namespace,
+    )
+
+    return type(  # type: ignore
+        f"StructArray[{struct_type.__name__}]",
+        (StructArray,),
+        {"_struct_type": struct_type, "_record_type": record_type},
+    )
+
+
+class StructArray(buffer_exporter, Generic[T]):
+    """Contiguous array of structs.
+
+    Example:
+        ```py
+        times = StructArray[Tm](10)
+        times[0].tm_year = 123
+        years = times.column("tm_year")
+        ```
+    """
+
+    _struct_type: Type[T]
+    _record_type: Type[ctypes.Structure]
+
+    def __class_getitem__(cls, struct_type: Any) -> Any:
+        if isinstance(struct_type, type) and issubclass(struct_type, Struct):
+            array_type = _STRUCT_ARRAYS.get(struct_type)
+
+            if not array_type:
+                array_type = _STRUCT_ARRAYS[struct_type] = _specialize(
+                    struct_type,
+                )
+
+            return array_type
+
+        # type variables and such, for annotations
+        return super().__class_getitem__(struct_type)  # type: ignore
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Number of structs to allocate, all zeroed.
+        """
+        if not hasattr(self, "_record_type"):
+            raise TypeError(
+                "StructArray needs a struct type, e.g. StructArray[Tm]",
+            )
+
+        self._elements: "ctypes.Array[Any]" = (self._record_type * length)()
+        self._owner: Any = None
+
+    @classmethod
+    def from_existing(cls, array: "ctypes.Array[Any]") -> "StructArray[T]":
+        """Wrap an existing ctypes array of structures, without copying it.
+
+        The structures only need the same layout as the struct, so arrays returned from C work as well.
+        """  # noqa
+        record_type = cls._record_type
+
+        if ctypes.sizeof(array._type_) != ctypes.sizeof(record_type):
+            raise TypeError(
+                f"{array._type_.__name__} does not match the layout of {cls._struct_type.__name__}",  # noqa
+            )
+
+        instance = cls.__new__(cls)
+        # from_buffer keeps the original array alive
+        instance._elements = (record_type * len(array)).from_buffer(array)
+        instance._owner = None
+        return instance
+
+    @classmethod
+    def from_address(
+        cls,
+        address: int,
+        length: int,
+        *,
+        owner: Any = None,
+    ) -> "StructArray[T]":
+        """Wrap contiguous structs at an address, without copying them.
+
+        Args:
+            address: Address of the first struct.
+            length: Number of structs.
+            owner: Object that owns the memory, kept alive by the array.
+        """
+        instance = cls.__new__(cls)
+        instance._elements = (cls._record_type * length).from_address(address)
+        instance._owner = owner
+        return instance
+
+    @property
+    def address(self) -> int:
+        """Address of the first struct."""
+        return ctypes.addressof(self._elements)
+
+    @property
+    def size(self) -> int:
+        """Size of the whole array."""
+        return ctypes.sizeof(self._elements)
+
+    @property
+    def _as_parameter_(self) -> "ctypes.Array[Any]":
+        return self._elements
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(address={self.address}, length={len(self)})"  # noqa
+
+    @overload
+    def __getitem__(self, index: int) -> StructRecord[T]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "StructArray[T]":
+        ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[StructRecord[T], "StructArray[T]"]:
+        """Get a record of a single struct, or a view of a contiguous part of the array."""  # noqa
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._elements))
+
+            if step != 1:
+                raise ValueError("array slices must be contiguous")
+
+            return self.from_address(
+                self.address + start * ctypes.sizeof(self._record_type),
+                max(stop - start, 0),
+                owner=self,
+            )
+
+        return self._elements[index]
+
+    def __setitem__(
+        self,
+        index: int,
+        value: Union[T, StructRecord[T], ctypes.Structure],
+    ) -> None:
+        source = value if isinstance(value, ctypes.Structure) else value.struct
+        record_type = self._record_type
+
+        if not isinstance(source, record_type):
+            if ctypes.sizeof(source) != ctypes.sizeof(record_type):
+                raise TypeError(
+                    f"{type(value).__name__} does not match the layout of {self._struct_type.__name__}",  # noqa
+                )
+
+            # the record keeps the source, and what it references, alive
+            source = record_type.from_buffer(source)
+
+        self._elements[index] = source
+
+    def __iter__(self) -> Iterator[StructRecord[T]]:
+        return iter(self._elements)
+
+    def column(self, name: str) -> CArrayPointer[Any]:
+        """Copy the raw value of a single field of every struct into an array.
+
+        Raises:
+            AttributeError: The struct has no such field.
+        """
+        internal = self._struct_type._internal_struct  # type: ignore
+        fields = {field[0]: field[1] for field in internal._fields_}
+
+        try:
+            ctype = fields[name]
+        except KeyError as e:
+            raise AttributeError(
+                f"{self._struct_type.__name__} has no field {name!r}",
+            ) from e
+
+        return array_from(
+            map(internal.__dict__[name].__get__, self._elements),
+            _ELEMENT_TYPES.get(ctype, ctype),
+        )
+
+    def _export_buffer(self) -> Tuple[int, int, int, str, bool]:
+        return self.address, self.size, 1, "B", False
+
+    def _release_buffer(self) -> None:
+        pass
+
+    def as_ndarray(self) -> "np.ndarray[Any, Any]":
+        """Get a structured ndarray sharing memory with the array.
+
+        Columns are available by name, e.g. `arr.as_ndarray()["tm_year"]`. Requires NumPy to be installed.
+        """  # noqa
+        from .ndarray import _import_numpy
+
+        np = _import_numpy()
+        # the view keeps the array, and whatever owns its memory, alive
+        return np.frombuffer(
+            memoryview(cast(bytearray, self)),
+            np.dtype(self._struct_type._internal_struct),  # type: ignore
+        )
@@ -1,16 +1,21 @@
 from __future__ import annotations
 import ctypes
 import faulthandler
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from functools import wraps
 from io import UnsupportedOperation
 from typing import (
-    TYPE_CHECKING, Any, Callable, NamedTuple, Type, TypeVar, Union
+    TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Type, TypeVar, Union
 )
-import os
-from _pointers import handle as _handle
+from _pointers import enter_unchecked as _enter_unchecked
+from _pointers import exit_unchecked as _exit_unchecked
+from _pointers import guarded as _guarded
+from _pointers import install_handler as _install_handler
+from _pointers import set_null_error as _set_null_error
+from _pointers import set_segv_error as _set_segv_error
+from _pointers import stop_handler as _stop_handler
 from typing_extensions import ParamSpec
-from .exceptions import SegmentViolation
+from .exceptions import NullPointerError, SegmentViolation
 
 if TYPE_CHECKING:
     from .structure import Struct, StructPointer
@@ -20,13 +25,19 @@ with suppress(
 ):  # in case its running in idle or something like that
     faulthandler.enable()
 
+# installed on top of faulthandler, which still gets faults outside of handle()
+_install_handler()
+_set_segv_error(SegmentViolation)
+_set_null_error(NullPointerError)
+
 __all__ = (
     "NULL",
     "Nullable",
     "raw_type",
     "handle",
     "struct_cast",
-    "stop_handler"
+    "stop_handler",
+    "unchecked",
 )
 
 T = TypeVar("T")
@@ -54,38 +65,37 @@ def raw_type(ct: Type["ctypes._CData"]) -> Any:
 
 def stop_handler() -> None:
     """Shutoff the SIGSEGV handler."""
-    os.environ["POINTERSPY_ALLOW_SEGV"] = "1"
-
-def handle(func: Callable[P, T]) -> Callable[P, T]:
-    """Handle segment violation errors when called."""
+    _stop_handler()
 
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        try:
-            faulthandler.disable()
-            call = _handle(func, args, kwargs)
 
-            with suppress(UnsupportedOperation):
-                faulthandler.enable()
+@contextmanager
+def unchecked() -> Iterator[None]:
+    """Skip the SIGSEGV handler for everything called inside the block.
 
-            return call
-        except (RuntimeError, OSError) as e:
-            msg = str(e)
+    The state is kept in a context variable, so it only affects the current
+    thread and asyncio task. Generators share their caller's context, so the
+    block must not span a `yield`. Segment violations inside the block will
+    crash the interpreter, so only use this on already validated code.
 
-            if not any(
-                {
-                    msg.startswith("segment violation"),
-                    msg.startswith("exception: access violation"),
-                }
-            ):
-                raise
+    Example:
+        ```py
+        ptr = to_ptr(1)
 
-            with suppress(UnsupportedOperation):
-                faulthandler.enable()
+        with unchecked():
+            for _ in range(1000):
+                ~ptr
+        ```
+    """
+    token = _enter_unchecked()
+    try:
+        yield
+    finally:
+        _exit_unchecked(token)
 
-            raise SegmentViolation(msg) from None
 
-    return wrapper
+def handle(func: Callable[P, T]) -> Callable[P, T]:
+    """Handle segment violation errors when called."""
+    return wraps(func)(_guarded(func))
 
 
 @handle
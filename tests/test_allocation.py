@@ -1,10 +1,20 @@
+import ctypes
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from ward import raises, test
+from ward import raises, skip, test
 
-from pointers import (DereferenceError, FreedMemoryError, InvalidSizeError,
-                      StackAllocatedPointer, acquire_stack_alloc, calloc, free,
-                      malloc, realloc)
+from pointers import (Arena, DereferenceError, FreedMemoryError,
+                      InvalidSizeError, Pool, StackAllocatedPointer,
+                      acquire_stack_alloc, array, array_from_ndarray, calloc,
+                      free, malloc, pool_malloc, realloc, to_c_ptr)
+from pointers.std_structs import Tm
+from pointers.structure import StructArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 @test("malloc and free")
@@ -100,6 +110,29 @@ def _():
     with raises(InvalidSizeError):
         realloc(ptr, 10)
 
+    arr = calloc(4, 28)
+    arr[1] = 5
+    assert realloc(arr, 28 * 8) is arr
+    assert arr.chunks == 8
+    assert arr.size == 28
+    assert ~arr[1] == 5
+    assert not arr[7].assigned
+
+    with raises(ValueError):
+        realloc(arr, 30)
+
+    with raises(ValueError):
+        realloc(arr + 1, 28)
+
+    realloc(arr, 28 * 2)
+    assert arr.chunks == 2
+    assert ~arr[1] == 5
+
+    with raises(IndexError):
+        arr[2]
+
+    free(arr)
+
 
 @test("allocation with tracked types")
 def _():
@@ -133,3 +166,283 @@ def _():
             ptr <<= "hello"
 
         assert ~ptr == 0
+
+
+@test("arenas")
+def _():
+    with raises(ValueError):
+        Arena(alignment=3)
+
+    with Arena(region_size=64) as arena:
+        ptr = arena.allocate(28)
+        ptr <<= 1
+        assert ~ptr == 1
+        assert arena.used == 28
+        assert ptr.address % 16 == 0
+
+        other = arena.allocate(28)
+        assert other.address == ptr.address + 32
+        assert arena.used == 60
+
+        large = arena.allocate(100)
+        assert arena.capacity == 164
+        free(large)
+        assert arena.used == 60
+
+        with raises(TypeError):
+            realloc(other, 30)
+
+        with memoryview(other + 4):
+            with raises(BufferError):
+                arena.reset()
+
+            with raises(BufferError):
+                arena.close()
+
+        arena.reset()
+        assert arena.used == 0
+        assert arena.high_water == 160
+
+        with raises(FreedMemoryError):
+            print(~ptr)
+
+        with raises(FreedMemoryError):
+            other.ensure_valid()
+
+        with raises(FreedMemoryError):
+            (other + 1).ensure_valid()
+
+        new = arena.allocate(28)
+        assert new.address == ptr.address
+        assert new.freed is False
+
+    assert arena.closed
+
+    with raises(FreedMemoryError):
+        arena.allocate(1)
+
+    # stricter than what malloc guarantees
+    with Arena(region_size=200, alignment=64) as arena:
+        for size in (1, 63, 64, 65, 150, 3, 200, 7):
+            assert arena.allocate(size).address % 64 == 0
+
+        arena.reset()
+        for size in (200, 5, 64):
+            assert arena.allocate(size).address % 64 == 0
+
+
+@test("pools")
+def _():
+    with Pool(28, 2) as pool:
+        a = pool.allocate()
+        b = pool.allocate()
+        assert pool.chunks == 1
+        assert pool.utilization == 1.0
+
+        a <<= 1
+        assert ~a == 1
+
+        c = pool.allocate()
+        assert pool.chunks == 2
+        assert pool.in_use == 3
+
+        free(b)
+        assert pool.in_use == 2
+        assert pool.allocate().address == b.address
+
+        with raises(FreedMemoryError):
+            free(b)
+
+        with raises(TypeError):
+            realloc(c, 64)
+
+        with memoryview(c):
+            with raises(BufferError):
+                pool.close()
+
+    with raises(FreedMemoryError):
+        print(~a)
+
+    ptr = pool_malloc(28)
+    assert ptr.size == 28
+    ptr <<= 2
+    assert ~ptr == 2
+    free(ptr)
+    assert pool_malloc(30).address == ptr.address
+
+    with raises(ValueError):
+        pool_malloc(-1)
+
+    shared = Pool(8, 4)
+
+    def work(marker: int) -> bool:
+        ptrs = [shared.allocate() for _ in range(100)]
+        for i, block in enumerate(ptrs):
+            ctypes.c_int64.from_address(block.address).value = marker + i
+
+        # two threads taking the same block would overwrite each other
+        intact = all(
+            ctypes.c_int64.from_address(block.address).value == marker + i
+            for i, block in enumerate(ptrs)
+        )
+        for block in ptrs:
+            free(block)
+
+        return intact
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            assert all(pool.map(work, range(0, 16000, 1000)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert shared.in_use == 0
+    shared.close()
+
+
+@test("calloc element views")
+def _():
+    ptr = calloc(3, 28)
+    last = ptr[2]
+    assert last.address == ptr.address + 56
+
+    with raises(IndexError):
+        ptr[3]
+
+    with raises(DereferenceError):
+        print(~last)
+
+    last <<= 1
+    assert ~ptr[2] == 1
+    assert [i.current_index for i in ptr + 1] == [1, 2]
+
+    free(ptr)
+    assert last.freed is True
+
+    with raises(FreedMemoryError):
+        print(~last)
+
+
+@test("allocated pointer views")
+def _():
+    ptr = malloc(8)
+    view = ptr + 1 + 1 + 1
+    assert view.address == ptr.address + 3
+    assert view.size == 5
+    assert (view - 2).address == ptr.address + 1
+
+    with raises(IndexError):
+        ptr + 8
+
+    with raises(IndexError):
+        ptr - 1
+
+    with raises(ValueError):
+        realloc(view, 16)
+
+    free(ptr)
+    assert view.freed is True
+
+    with raises(FreedMemoryError):
+        free(view)
+
+
+@test("buffer exports")
+def _():
+    ptr = malloc(8)
+    view = memoryview(ptr)
+    assert (view.format, view.itemsize, view.shape) == ("B", 1, (8,))
+
+    view[:4] = b"test"
+    assert bytes(memoryview(ptr + 1)[:3]) == b"est"
+
+    with raises(BufferError):
+        free(ptr)
+
+    view.release()
+    free(ptr)
+
+    with raises(FreedMemoryError):
+        memoryview(ptr)
+
+    arr = calloc(4, 8)
+
+    with memoryview(arr + 1) as view:
+        assert view.nbytes == 24
+
+        with raises(BufferError):
+            free(arr)
+
+    free(arr)
+
+    ptr = malloc(64)
+    inner = ptr + 8
+    address = ptr.address
+
+    with memoryview(inner):
+        # the export keeps the block, and every view into it, alive
+        with raises(BufferError):
+            realloc(ptr, 1 << 20)
+
+        assert ptr.address == address
+        inner.ensure_valid()
+
+    realloc(ptr, 1 << 20)
+    assert ptr.address != address
+
+    with raises(FreedMemoryError):
+        inner.ensure_valid()
+
+    with memoryview(ptr):
+        with raises(BufferError):
+            realloc(ptr, 64)
+
+    realloc(ptr, 64)
+    free(ptr)
+
+    values = memoryview(array(1, 2, 3))
+    assert values.format == "i"
+    assert values.itemsize == ctypes.sizeof(ctypes.c_int)
+    assert values.tolist() == [1, 2, 3]
+
+
+@skip("numpy is not installed", when=np is None)
+@test("ndarray bridge")
+def _():
+    values = array(1, 2, 3).as_ndarray()
+    assert values.dtype == np.int32
+    values[0] = 4
+    assert values.tolist() == [4, 2, 3]
+
+    ptr = malloc(16)
+    floats = ptr.as_ndarray(ctypes.c_double)
+    floats[:] = [1.5, 2.5]
+    assert memoryview(ptr).cast("d").tolist() == [1.5, 2.5]
+
+    with raises(BufferError):
+        free(ptr)
+
+    del floats
+    free(ptr)
+
+    c_ptr = to_c_ptr(1)
+    c_ptr.as_ndarray()[0] = 2
+    assert ~c_ptr == 2
+
+    with raises(TypeError):
+        to_c_ptr("a").as_ndarray()
+
+    data = np.arange(6, dtype=np.int32).reshape(2, 3)
+    arr = array_from_ndarray(data)
+    data[1, 2] = 10
+    assert ~arr == [0, 1, 2, 3, 4, 10]
+    assert arr.as_ndarray().ctypes.data == data.ctypes.data
+
+    with raises(ValueError):
+        array_from_ndarray(np.arange(6)[::2])
+
+    times = StructArray[Tm](3)
+    times.as_ndarray()["tm_year"] = 100
+    assert times[2].tm_year == 100
@@ -1,8 +1,14 @@
+import ctypes
+import warnings
+
 from ward import raises, test
 
 from pointers import (
+    NULL,
     InvalidBindingParameter,
+    PointerArray,
     Struct,
+    StructArray,
     StructPointer,
     TypedCPointer,
     VoidPointer,
@@ -15,6 +21,7 @@ from pointers import (
     cast,
     div,
     isspace,
+    qsort,
     signal,
     sprintf,
     strcpy,
@@ -24,7 +31,10 @@ from pointers import (
     to_voidp,
     toupper,
 )
-from pointers.std_structs import DivT
+from pointers import bindings
+from pointers.api_bindings import PyEval
+from pointers.bindings import binding_base
+from pointers.std_structs import DivT, Tm, VarObject
 
 
 @test("c strings")
@@ -113,6 +123,27 @@ def _():
         class Foo(Struct):
             bar: TypedCPointer
 
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert A(3, 4, do_sync=False).two == 4
+
+    assert caught[0].category is DeprecationWarning
+
+    class Counted(Struct):
+        one: int
+        two: int
+        inits = 0
+
+        def __init__(self, *args) -> None:
+            super().__init__(*args)
+            type(self).inits += 1
+
+    raw = Counted._internal_struct(5, 6)
+    wrapped = Counted.from_existing(raw)
+    assert Counted.inits == 0
+    wrapped.one = 7
+    assert raw.one == 7
+
 
 @test("custom bindings")
 def _():
@@ -155,3 +186,179 @@ def _():
     assert type(voidp) is VoidPointer
 
     assert ~cast(voidp, int) == 1
+
+
+@test("call plans")
+def _():
+    fn = ctypes.CDLL(None).abs
+    fn.argtypes = (ctypes.c_int,)
+    fn.restype = ctypes.c_int
+
+    assert binding_base(fn, -1) == 1
+
+    # a cached plan must not keep accepting a type that failed before
+    with raises(InvalidBindingParameter):
+        binding_base(fn, "a")
+
+    with raises(InvalidBindingParameter):
+        binding_base(fn, "a")
+
+    fn.argtypes = (ctypes.c_char_p,)
+    fn.restype = ctypes.c_char_p
+    assert binding_base(fn, NULL) is None
+
+
+@test("callback trampolines")
+def _():
+    arr = (ctypes.c_int * 4)(3, 1, 4, 2)
+    ptr = VoidPointer(ctypes.addressof(arr), ctypes.sizeof(arr))
+
+    def compar(a: VoidPointer, b: VoidPointer) -> int:
+        return ~cast(a, int) - ~cast(b, int)
+
+    qsort(ptr, 4, ctypes.sizeof(ctypes.c_int), compar)
+    assert list(arr) == [1, 2, 3, 4]
+
+    size = len(bindings._TRAMPOLINES)
+    qsort(ptr, 4, ctypes.sizeof(ctypes.c_int), compar)
+    assert len(bindings._TRAMPOLINES) == size
+
+    for _ in range(bindings._MAX_TRAMPOLINES + 10):
+        qsort(ptr, 4, ctypes.sizeof(ctypes.c_int), lambda a, b: 0)
+
+    assert len(bindings._TRAMPOLINES) == bindings._MAX_TRAMPOLINES
+
+    @binds(std.dll.qsort, keep_alive=True)
+    def pinned_qsort(base, nitem: int, size: int, compar) -> None:
+        ...
+
+    def reverse(a: VoidPointer, b: VoidPointer) -> int:
+        return ~cast(b, int) - ~cast(a, int)
+
+    pinned_qsort(ptr, 4, ctypes.sizeof(ctypes.c_int), reverse)
+    assert list(arr) == [4, 3, 2, 1]
+    pinned = bindings._TRAMPOLINES[
+        (reverse, std.dll.qsort.argtypes[3], id(bindings.STRUCT_MAP))
+    ].c_func
+
+    for _ in range(bindings._MAX_TRAMPOLINES + 10):
+        qsort(ptr, 4, ctypes.sizeof(ctypes.c_int), lambda a, b: 0)
+
+    assert pinned in bindings._PINNED.values()
+
+
+@test("call plan cache")
+def _():
+    # indexing a library creates a new function pointer every time, and
+    # those are not kept around forever
+    for _ in range(bindings._MAX_PLANS + 10):
+        fn = std.dll["abs"]
+        fn.argtypes = (ctypes.c_int,)
+        assert binding_base(fn, -1) == 1
+
+    assert len(bindings._PLANS) == bindings._MAX_PLANS
+
+
+@test("lazy api functions")
+def _():
+    from pointers._pyapi import API_FUNCS
+
+    assert "PyLong_FromLong" in API_FUNCS
+    func, _, name = API_FUNCS["PyLong_FromLong"]
+    assert name == "PyLong_FromLong"
+    assert func is not None
+    assert func.restype is ctypes.py_object
+    assert API_FUNCS["PyLong_FromLong"][0] is func
+
+    with raises(KeyError):
+        API_FUNCS["not_an_api_function"]
+
+
+@test("struct fields")
+def _():
+    class Pair(Struct):
+        name: bytes
+        value: int
+        data: VoidPointer
+
+    pair = Pair(b"a", 1, 0)
+    assert (pair.name, pair.value) == ("a", 1)
+
+    # fields read from the underlying structure, not a copy of it
+    pair.struct.value = 2
+    assert pair.value == 2
+
+    pair.value = 3
+    assert pair.struct.value == 3
+    assert type(pair.data) is VoidPointer
+
+    class SizedObject(VarObject):
+        ob_size: int
+
+    fields = dict(SizedObject._internal_struct._fields_)
+    assert fields["ob_size"] is ctypes.c_ssize_t
+
+
+@test("zero-copy structs")
+def _():
+    raw = DivT._internal_struct(1, 2)
+    res = DivT.from_existing(raw)
+    assert res.get_existing_address() == ctypes.addressof(raw)
+    assert "quot" not in vars(res)
+
+    raw.quot = 5
+    assert res.quot == 5
+
+    res.rem = 6
+    assert raw.rem == 6
+
+
+@test("struct arrays")
+def _():
+    class Record(Struct):
+        key: bytes
+        value: int
+
+    records = StructArray[Record](4)
+    assert StructArray[Record] is type(records)
+    assert len(records) == 4
+
+    for i, record in enumerate(records):
+        record.value = i * 10
+
+    records[0].key = b"first"
+    assert records[0].key == "first"
+    assert records[-1].value == 30
+    assert records[1].to_struct().value == 10
+
+    records[2] = Record(b"new", 5)
+    assert (records[2].key, records[2].value) == ("new", 5)
+
+    tail = records[2:]
+    assert len(tail) == 2
+    tail[1].value = 99
+    assert records[3].value == 99
+
+    assert ~records.column("value") == [0, 10, 5, 99]
+
+    with raises(AttributeError):
+        records.column("missing")
+
+    with raises(TypeError):
+        StructArray(4)
+
+    raw = (std.tm * 2)()
+    times = StructArray[Tm].from_existing(raw)
+    raw[1].tm_year = 123
+    assert times[1].tm_year == 123
+
+
+@test("passing pointer arrays as PyObject**")
+def _():
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    args = PointerArray([1, 2])
+    assert PyEval.eval_code_ex(
+        add.__code__, {}, None, args, 2, None, 0, None, 0, None, None
+    ) == 3
@@ -62,3 +62,21 @@ def _():
         assert type(c) is Pointer
 
     func2("a", 1, "c")
+
+
+@test("decay with keywords and defaults")
+def _():
+    @decay
+    def func(a: "Later", b: int = 1, *, c: Pointer[int], d: Pointer = None):
+        assert type(a) is Pointer
+        assert type(b) is int
+        assert type(c) is Pointer
+        return d
+
+    func("a", c=1)
+    func(a="a", b=2, c=1)
+    assert type(func("a", 2, c=1, d=3)) is Pointer
+    assert func("a", c=1) is None
+
+
+Later = Pointer[str]  # resolved on the first call, not at decoration
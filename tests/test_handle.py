@@ -0,0 +1,148 @@
+import asyncio
+import ctypes
+import faulthandler
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ward import raises, test
+
+from pointers import SegmentViolation, handle, unchecked
+
+
+@handle
+def _read(address: int) -> int:
+    return ctypes.c_int.from_address(address).value
+
+
+@handle
+def _foreign_call(address: int) -> None:
+    # ctypes releases the GIL around foreign calls
+    ctypes.memmove(address, address + 8, 8)
+
+
+@test("segment violations")
+def _():
+    for _ in range(3):
+        with raises(SegmentViolation):
+            _read(8)
+
+    with raises(SegmentViolation):
+        _foreign_call(8)
+
+    value = ctypes.c_int(42)
+    assert _read(ctypes.addressof(value)) == 42
+
+
+@test("replaced signal handlers")
+def _():
+    signal.signal(signal.SIGSEGV, signal.SIG_DFL)
+    with raises(SegmentViolation):
+        _read(8)
+
+    # ward captures stderr, which has no file descriptor
+    faulthandler.disable()
+    faulthandler.enable(sys.__stderr__)
+    with raises(SegmentViolation):
+        _read(8)
+
+
+@test("nested handlers")
+def _():
+    @handle
+    def outer():
+        with raises(SegmentViolation):
+            _read(8)
+
+        return _read(8)
+
+    with raises(SegmentViolation):
+        outer()
+
+    @handle
+    def add(a: int, *, b: int = 1) -> int:
+        return a + b
+
+    assert add(1) == 2
+    assert add(1, b=2) == 3
+    assert add.__name__ == "add"
+
+
+@test("concurrent handlers")
+def _():
+    @handle
+    def copy(value: int) -> int:
+        src = ctypes.c_int(value)
+        dest = ctypes.c_int(0)
+        ctypes.memmove(ctypes.addressof(dest), ctypes.addressof(src), 4)
+        return dest.value
+
+    @handle
+    def work(index: int) -> int:
+        total = 0
+
+        for i in range(200):
+            if (i + index) % 7 == 0:
+                with raises(SegmentViolation):
+                    _foreign_call(8)
+            else:
+                total += copy(i)
+
+        return total
+
+    expected = [
+        sum(i for i in range(200) if (i + index) % 7) for index in range(64)
+    ]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(work, range(64))) == expected
+    finally:
+        sys.setswitchinterval(interval)
+
+
+@test("unchecked blocks")
+def _():
+    value = ctypes.c_int(42)
+
+    with unchecked():
+        assert _read(ctypes.addressof(value)) == 42
+
+        with unchecked():
+            assert _read(ctypes.addressof(value)) == 42
+
+        # other threads keep their handler
+        with ThreadPoolExecutor(1) as pool:
+            with raises(SegmentViolation):
+                pool.submit(_read, 8).result()
+
+    with raises(SegmentViolation):
+        _read(8)
+
+
+@test("unchecked blocks across tasks")
+def _():
+    value = ctypes.c_int(42)
+
+    async def suspended(entered: asyncio.Event, done: asyncio.Event):
+        with unchecked():
+            entered.set()
+            await done.wait()
+            assert _read(ctypes.addressof(value)) == 42
+
+    async def main():
+        entered = asyncio.Event()
+        done = asyncio.Event()
+        task = asyncio.ensure_future(suspended(entered, done))
+        await entered.wait()
+
+        # the suspended task must not turn the handler off for this one
+        with raises(SegmentViolation):
+            _read(8)
+
+        done.set()
+        await task
+
+    asyncio.run(main())
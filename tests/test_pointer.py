@@ -1,8 +1,20 @@
+import array as py_array
+import ctypes
+import gc
+import subprocess
+import sys
+import weakref
+from typing import Callable
+
 from ward import raises, test
 
-from pointers import NULL, InvalidSizeError, Pointer
+from pointers import (
+    NULL, InvalidSizeError, Pointer, PointerArray, VoidPointer, deref_many,
+    to_ptrs
+)
 from pointers import _ as m
-from pointers import to_c_ptr, to_ptr
+from pointers import array, array_from, to_c_ptr, to_ptr
+from pointers._utils import get_mapped
 from pointers.exceptions import NullPointerError
 
 
@@ -43,6 +55,13 @@ def _():
     with raises(InvalidSizeError):
         ptr <<= 758347580937450893
 
+    # the size of the first target still applies after reassigning
+    ptr = to_ptr(int("763723"))
+    ptr <<= int("763724")
+    ptr >>= int("1" * 30)
+    with raises(InvalidSizeError):
+        ptr <<= int("2" * 20)
+
 
 @test("assignment with tracked types")
 def _():
@@ -86,3 +105,265 @@ def _():
     ptr = m & "test"
     assert type(ptr) is Pointer
     assert m * ptr == "test"
+
+
+@test("lazy submodules")
+def _():
+    code = """
+import sys
+import pointers
+
+assert "pointers.api_bindings" not in sys.modules
+assert "pointers.bindings" not in sys.modules
+assert "varname" not in sys.modules
+
+assert pointers.to_var_ptr.__module__ == "pointers.var_pointer"
+assert callable(pointers.decay)
+
+namespace = {}
+exec("from pointers import *", namespace)
+assert "strlen" in namespace
+assert set(pointers.__all__) <= set(namespace)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@test("c array element access")
+def _():
+    arr = array(*range(10))
+    assert len(arr) == 10
+    assert (arr[3], arr[-1]) == (3, 9)
+
+    arr[0] = 42
+    assert ~arr == [42, *range(1, 10)]
+
+    with raises(IndexError):
+        arr[10]
+
+    part = arr[2:5]
+    assert ~part == [2, 3, 4]
+    part[0] = -1
+    assert arr[2] == -1
+
+    with raises(ValueError):
+        arr[::2]
+
+    arr.fill(7)
+    assert arr.tolist() == [7] * 10
+
+    arr.copy_from(py_array.array("i", range(3)))
+    arr[8:].copy_from(x * 2 for x in range(2))
+    assert ~arr == [0, 1, 2, 7, 7, 7, 7, 7, 0, 2]
+
+    with raises(ValueError):
+        arr.copy_from(range(11))
+
+    strings = array("a", "b")
+    strings.fill("c")
+    assert ~strings == ["c", "c"]
+
+    # each slot keeps its own string alive after another one is replaced
+    strings = array("a", "b", "c")
+    strings.fill("zz" * 30)
+    strings[0] = "q"
+    garbage = ["x" * 60 for _ in range(1000)]
+    assert strings.tolist() == ["q", "zz" * 30, "zz" * 30]
+    del garbage
+
+    data = array(b"a", b"b")
+    data.fill(b"yy" * 30)
+    data[0] = b"q"
+    assert data.tolist() == [b"q", b"yy" * 30]
+
+
+@test("arrays from iterables and buffers")
+def _():
+    squares = array_from(i * i for i in range(10_000))
+    assert len(squares) == 10_000
+    assert squares[-1] == 9999 * 9999
+
+    doubles = array_from(py_array.array("d", [1.5, 2.5]))
+    assert ~doubles == [1.5, 2.5]
+    assert ~array_from(b"ab") == [97, 98]
+    assert ~array_from(range(3), float) == [0.0, 1.0, 2.0]
+    assert ~array_from(iter(["a", "bc"])) == ["a", "bc"]
+
+    with raises(ValueError):
+        array_from(py_array.array("i", [1, 2, 3]), ctypes.c_double)
+
+    with raises(ValueError):
+        array_from([])
+
+    with raises(TypeError):
+        array_from(b"ab", str)
+
+    # slices keep the memory alive after the array itself is gone
+    tail = array(1, 2, 3)[1:]
+    assert ~tail == [2, 3]
+
+
+@test("type mapping")
+def _():
+    assert get_mapped(int) is ctypes.c_int
+    assert get_mapped(VoidPointer) is ctypes.c_void_p
+    assert get_mapped(ctypes.c_double) is ctypes.c_double
+    assert get_mapped(Pointer) is ctypes.py_object
+
+    fn_type = get_mapped(Callable[[int], float])
+    assert get_mapped(Callable[[int], float]) is fn_type
+    assert fn_type._restype_ is ctypes.c_float
+
+    def callback(a: int) -> float:
+        ...
+
+    assert get_mapped(callback) is fn_type
+    callback.__annotations__["a"] = str
+    assert get_mapped(callback)._argtypes_ == (ctypes.c_wchar_p,)
+    assert ~to_c_ptr(42) == 42
+
+
+@test("mapping ctypes types")
+def _():
+    for typ in (
+        ctypes.c_int,
+        ctypes.c_uint8,
+        ctypes.c_double,
+        ctypes.c_char_p,
+        ctypes.c_wchar_p,
+        ctypes.c_void_p,
+    ):
+        assert get_mapped(typ) is typ
+        # cached results are the same
+        assert get_mapped(typ) is typ
+
+    class Custom(ctypes.c_long):
+        pass
+
+    assert get_mapped(Custom) is Custom
+    # non-simple ctypes types are still passed as objects
+    assert get_mapped(ctypes.POINTER(ctypes.c_int)) is ctypes.py_object
+    assert get_mapped(object) is ctypes.py_object
+
+
+@test("pointer references")
+def _():
+    value = object()
+    count = sys.getrefcount(value)
+    ptr = to_ptr(value)
+    assert sys.getrefcount(value) == count + 1
+    assert not hasattr(ptr, "__dict__")
+
+    ptr >>= NULL
+    assert sys.getrefcount(value) == count
+    ptr >>= value
+    assert sys.getrefcount(value) == count + 1
+
+    ref = weakref.ref(ptr)
+    assert ref() is ptr
+
+    del ptr
+    assert sys.getrefcount(value) == count
+    assert ref() is None
+
+
+@test("pointers in reference cycles")
+def _():
+    class Node:
+        pass
+
+    node = Node()
+    node.ptr = to_ptr(node)
+    assert ~node.ptr is node
+    assert node in gc.get_referents(node.ptr)
+
+    ref = weakref.ref(node)
+    del node
+    gc.collect()
+    assert ref() is None
+
+
+@test("pointing to many objects")
+def _():
+    value = object()
+    count = sys.getrefcount(value)
+    ptrs = to_ptrs([value, "a", 1])
+    assert type(ptrs) is PointerArray
+    assert sys.getrefcount(value) == count + 1
+    assert len(ptrs) == 3
+    assert ptrs[0] is value
+    assert ptrs[-1] == 1
+    assert list(ptrs) == [value, "a", 1]
+    assert list(to_ptrs(iter("abc"))) == ["a", "b", "c"]
+
+    with raises(IndexError):
+        ptrs[3]
+
+    from_addresses = deref_many([id(value), None])
+    assert from_addresses[0] is value
+
+    with raises(NullPointerError):
+        from_addresses[1]
+
+    del ptrs, from_addresses
+    assert sys.getrefcount(value) == count
+
+
+@test("pointer arrays")
+def _():
+    value = object()
+    count = sys.getrefcount(value)
+    ptrs = PointerArray(["a", "b", "c"])
+    assert list(PointerArray()) == []
+
+    ptrs[0] = value
+    assert sys.getrefcount(value) == count + 1
+    assert ptrs[0] is value
+
+    ptrs[1:] = ["x", "y"]
+    assert list(ptrs) == [value, "x", "y"]
+    assert list(ptrs[::-1]) == ["y", "x", value]
+    assert type(ptrs[1:]) is PointerArray
+    assert sys.getrefcount(value) == count + 1
+
+    with raises(ValueError):
+        ptrs[1:] = ["z"]
+
+    with raises(TypeError):
+        del ptrs[0]
+
+    with raises(TypeError):
+        ptrs["a"]
+
+    args = ctypes.cast(ptrs.address, ctypes.POINTER(ctypes.py_object))
+    assert args[1] == "x"
+    assert ptrs._as_parameter_[2] == "y"
+
+    ptrs[0] = "a"
+    assert sys.getrefcount(value) == count
+
+
+@test("arrays release their memory")
+def _():
+    from pointers import c_pointer
+
+    freed = []
+    c_free = c_pointer.c_free
+    c_pointer.c_free = lambda address: freed.append(c_free(address))
+
+    try:
+        ptr = array_from([1, 2, 3])
+        tail = ptr[1:]
+        ref = weakref.ref(ptr)
+        del ptr
+        gc.collect()
+        # the slice is still using the memory
+        assert ref() is not None
+        assert ~tail == [2, 3]
+        assert not freed
+
+        del tail
+        gc.collect()
+        assert ref() is None
+        assert len(freed) == 1
+    finally:
+        c_pointer.c_free = c_free